@@ -87,13 +87,8 @@ async def upload_file(
             )
         else:
             # Legacy: 전역 uploaded_files 리스트만 갱신
-            current_files = agent_manager.get_context().get("uploaded_files", [])
-            filtered = [entry for entry in current_files if entry.get("filename") != file.filename]
             relative_path = f"/static/uploads/{file.filename}"
-            filtered.append({"filename": file.filename, "path": relative_path})
-            if len(filtered) > 50:
-                filtered = filtered[-50:]
-            agent_manager.update_context("uploaded_files", filtered)
+            agent_manager.add_uploaded_file(file.filename, relative_path)
 
         return {
             "conversation_id": conversation_id,
@@ -106,7 +101,7 @@ async def upload_file(
 
 @router.get("/context")
 async def get_context():
-    return agent_manager.get_context()
+    return agent_manager.export_context()
 
 @router.get("/conversations")
 async def list_conversations():
@@ -351,7 +346,7 @@ async def chat_stream(request: ChatRequest):
                 # Extract context from files (Using NEW Conversation File Logic ideally, but falling back to global for safety/compatibility)
                 # Ideally: agent_manager.get_conversation_files_with_text(conversation_id)
                 # But kept simpler for now to match previous logic structure
-                uploaded_files = context.get("uploaded_files", [])
+                uploaded_files = agent_manager.list_uploaded_files()
                 file_context_str = ""
                 
                 if uploaded_files:
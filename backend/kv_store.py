@@ -1,23 +1,44 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     import redis  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     redis = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CONTEXT_KEY = os.getenv("ESG_CONTEXT_KEY", "esg_ai_agent_context")
 
 
+def _dumps(data: Any):
+    # orjson이 있으면 bytes로 바로 직렬화 (stdlib json 대비 수 배 빠름)
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _loads(raw: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class RedisKVStore:
     """간단한 키-값 스토어 래퍼 (Redis 없으면 비활성)."""
 
     def __init__(self) -> None:
         self._client: Optional["redis.Redis"] = None
+        # Redis가 없을 때 blob(업로드 파일 본문 등)을 보관하는 메모리 저장소
+        # 대화가 text_ref로 참조하는 동안은 지우지 않음 - 대화 삭제 시 delete_blobs로만 제거
+        self._local_blobs: Dict[str, str] = {}
         if redis is None:
             LOGGER.warning("redis 패키지가 설치되지 않아 KV 스토어 기능이 비활성화됩니다.")
             return
@@ -42,8 +63,8 @@ class RedisKVStore:
         if not data:
             return None
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return _loads(data)
+        except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError 모두 ValueError 하위
             LOGGER.error("Redis에 저장된 컨텍스트 JSON 파싱 실패")
             return None
 
@@ -51,12 +72,50 @@ class RedisKVStore:
         if not self._client:
             return False
         try:
-            payload = json.dumps(context, ensure_ascii=False)
+            payload = _dumps(context)
             self._client.set(CONTEXT_KEY, payload)
             return True
         except Exception as exc:  # pragma: no cover - 네트워크 예외
             LOGGER.error("Redis 컨텍스트 저장 실패: %s", exc)
             return False
 
+    def set_blob(self, key: str, value: str) -> bool:
+        """컨텍스트와 분리된 키에 큰 텍스트를 저장 (Redis 없으면 메모리 보관)."""
+        if not self._client:
+            self._local_blobs[key] = value
+            return True
+        try:
+            self._client.set(key, value)
+            return True
+        except Exception as exc:  # pragma: no cover - 네트워크 예외
+            LOGGER.error("Redis blob 저장 실패(%s): %s", key, exc)
+            self._local_blobs[key] = value
+            return False
+
+    def get_blobs(self, keys: List[str]) -> List[Optional[str]]:
+        """여러 blob을 한 번의 MGET으로 조회 (없는 키는 None)."""
+        if not keys:
+            return []
+        values: List[Optional[str]] = [None] * len(keys)
+        if self._client:
+            try:
+                values = self._client.mget(keys)
+            except Exception as exc:  # pragma: no cover - 네트워크 예외
+                LOGGER.error("Redis blob 조회 실패: %s", exc)
+        return [
+            value if value is not None else self._local_blobs.get(key)
+            for key, value in zip(keys, values)
+        ]
+
+    def delete_blobs(self, keys: List[str]) -> None:
+        for key in keys:
+            self._local_blobs.pop(key, None)
+        if not self._client or not keys:
+            return
+        try:
+            self._client.delete(*keys)
+        except Exception as exc:  # pragma: no cover - 네트워크 예외
+            LOGGER.error("Redis blob 삭제 실패: %s", exc)
+
 
 kv_store = RedisKVStore()
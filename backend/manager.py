@@ -1,9 +1,15 @@
 import sys
 import os
+import hashlib
+import io
 import logging
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from pathlib import Path
 
 # Add project root to sys.path to allow importing src
@@ -13,16 +19,42 @@ from src.tools.regulation_tool import _monitor_instance as regulation_monitor
 from src.tools.risk import RiskToolOrchestrator
 from src.tools.policy_tool import policy_guideline_tool
 from src.tools.report_tool import draft_report
-from src.workflows.custom_graph import run_langgraph_pipeline
 from backend.kv_store import kv_store
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import Chroma
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+
+# 임베딩/벡터DB/LLM/LangGraph 모듈은 import 비용이 커서 실제로 필요한 시점에 불러옴
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from langchain_openai import ChatOpenAI
 
 LOGGER = logging.getLogger(__name__)
 CONVERSATION_VECTOR_DIR = Path("vector_db/conversations")
+# 업로드 파일 본문은 컨텍스트와 분리된 키에 저장해 매 저장 시 직렬화되지 않도록 함
+FILE_TEXT_KEY_PREFIX = "file_text:"
+MAX_UPLOADED_FILES = 50
+# 동시에 열어둘 대화방 Chroma 핸들 수 (초과 시 가장 오래 사용하지 않은 것부터 해제)
+MAX_CACHED_VECTORSTORES = 32
+# 같은 본문 재업로드 시 청크 분할을 다시 하지 않도록 보관할 결과 수
+MAX_CACHED_SPLITS = 256
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=1)
+def get_embeddings() -> "HuggingFaceEmbeddings":
+    """업로드 파일 청크용 임베딩 모델 (첫 업로드/검색 시 1회 로드)"""
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(model_name="BAAI/bge-m3")
+
+
+@lru_cache(maxsize=1)
+def _title_llm_singleton() -> "ChatOpenAI":
+    from langchain_openai import ChatOpenAI
+
+    # 여러 AgentManager가 하나의 HTTP 클라이언트/커넥션 풀을 공유하도록 프로세스 단위로 1회 생성
+    # 짧은 제목만 필요하므로 낮은 temperature와 max_tokens 설정
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0.1, max_tokens=32)
 
 
 class AgentManager:
@@ -31,46 +63,88 @@ class AgentManager:
     def __init__(self):
         # ① 업로드된 파일·규제 업데이트·정책 분석 등 모든 컨텍스트를 저장
         default_context: Dict[str, Any] = {
-            "uploaded_files": [],
+            # 파일명 → {"filename", "path"} (삽입 순서 유지, 저장 시에는 리스트로 직렬화)
+            "uploaded_files": OrderedDict(),
             "regulation_updates": None,
             "policy_analysis": None,
             "risk_assessment": None,
             "report_draft": None,
-            "chat_history": [],  # legacy
             # 대화방별로 메시지를 보관하기 위한 저장소
             "conversations": {},
         }
         persisted = kv_store.load_context() or {}
+        # 더 이상 사용하지 않는 legacy 키는 복원하지 않음
+        persisted.pop("chat_history", None)
         # ④ Redis에 저장된 값이 있다면 기본 컨텍스트 위에 덮어써 복원
         default_context.update(persisted)
         
         # [Strict Session] 서버 시작 시 과거 업로드 파일 기록은 초기화함 (User Request)
         # Persistent context should keep generic things, but files should be current session only.
-        default_context["uploaded_files"] = [] 
+        default_context["uploaded_files"] = OrderedDict()
         
         self.shared_context = default_context
         self._risk_orchestrator = RiskToolOrchestrator()
         CONVERSATION_VECTOR_DIR.mkdir(parents=True, exist_ok=True)
-        # 업로드 파일용 임베딩/텍스트 분할기 (벡터DB에 재사용)
-        # 업로드 파일을 Chroma에 넣기 위한 임베딩/청크 분리기
-        self._conv_embeddings = HuggingFaceEmbeddings(model_name="BAAI/bge-m3")
+        # 업로드 파일을 Chroma에 넣기 위한 청크 분리기 (임베딩은 get_embeddings()에서 지연 로드)
         self._conv_splitter = RecursiveCharacterTextSplitter(chunk_size=800, chunk_overlap=120)
-        self._title_llm: Optional[ChatOpenAI] = None
+        # 본문 해시(blake2s) → 청크 리스트 LRU 캐시
+        self._chunk_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        # 대화방별 Chroma 핸들 LRU 캐시 (매 호출마다 SQLite/HNSW를 다시 열지 않도록)
+        self._vectorstores: "OrderedDict[str, Chroma]" = OrderedDict()
+        self._vectorstore_lock = threading.Lock()
+        # 대화방 벡터DB에 내용이 있는지 여부 캐시 (검색마다 디렉터리 stat/iterdir 방지)
+        self._vector_has_content: Dict[str, bool] = {}
 
     def get_context(self) -> Dict[str, Any]:
         return self.shared_context
 
+    def export_context(self) -> Dict[str, Any]:
+        """API 응답·Redis 저장용 컨텍스트 (uploaded_files를 리스트로 변환)"""
+        return {**self.shared_context, "uploaded_files": self.list_uploaded_files()}
+
     def update_context(self, key: str, value: Any):
         self.shared_context[key] = value
         self._persist_context()
 
+    def list_uploaded_files(self) -> List[Dict[str, Any]]:
+        return list(self.shared_context.get("uploaded_files", {}).values())
+
+    def add_uploaded_file(self, filename: str, path: str):
+        self._remember_uploaded_file(filename, path)
+        self._persist_context()
+
+    def _remember_uploaded_file(self, filename: str, path: str):
+        # 같은 파일명은 맨 뒤로 재삽입하고 최대 개수를 넘으면 가장 오래된 항목 제거
+        uploaded = self.shared_context.setdefault("uploaded_files", OrderedDict())
+        uploaded.pop(filename, None)
+        uploaded[filename] = {"filename": filename, "path": path}
+        if len(uploaded) > MAX_UPLOADED_FILES:
+            uploaded.popitem(last=False)
+
     def _persist_context(self):
         # ⑤ Redis 사용 가능 시 전체 컨텍스트를 JSON으로 동기화
-        if not kv_store.save_context(self.shared_context):
+        if not kv_store.save_context(self.export_context()):
             LOGGER.warning("Redis 컨텍스트 저장 실패 - 메모리 모드로 지속")
 
     def _now(self) -> str:
-        return datetime.now(timezone.utc).isoformat()
+        return datetime.now(_UTC).isoformat(timespec="milliseconds")
+
+    def _touch(self, conversation: Dict[str, Any]):
+        # 정렬은 정수 epoch(ns)로, 표시용으로는 ISO 문자열을 함께 보관
+        conversation["updated_at"] = self._now()
+        conversation["updated_at_epoch"] = time.time_ns()
+
+    @staticmethod
+    def _updated_epoch(conversation: Dict[str, Any]) -> int:
+        epoch = conversation.get("updated_at_epoch")
+        if epoch is not None:
+            return epoch
+        # updated_at_epoch 도입 이전에 저장된 대화방
+        updated_at = conversation.get("updated_at")
+        try:
+            return int(datetime.fromisoformat(updated_at).timestamp() * 1_000_000_000)
+        except (TypeError, ValueError):
+            return 0
 
     def _get_conversations(self) -> Dict[str, Any]:
         # Redis 복원 시 conversations 키가 없을 수 있으므로 setdefault 사용
@@ -78,8 +152,9 @@ class AgentManager:
 
     def list_conversations(self) -> List[Dict[str, Any]]:
         conversations = self._get_conversations()
+        ranked = sorted(conversations.values(), key=self._updated_epoch, reverse=True)
         summaries: List[Dict[str, Any]] = []
-        for convo in conversations.values():
+        for convo in ranked:
             messages = convo.get("messages", [])
             last_message = messages[-1]["content"] if messages else ""
             summaries.append({
@@ -88,11 +163,7 @@ class AgentManager:
                 "updated_at": convo.get("updated_at"),
                 "last_message": last_message,
             })
-        return sorted(
-            summaries,
-            key=lambda item: item.get("updated_at") or "",
-            reverse=True,
-        )
+        return summaries
 
     def create_conversation(self, title: Optional[str] = None) -> Dict[str, Any]:
         # ChatGPT처럼 UUID 기반 세션을 생성
@@ -106,6 +177,7 @@ class AgentManager:
             "reports": [],
             "created_at": now,
             "updated_at": now,
+            "updated_at_epoch": time.time_ns(),
         }
         conversations = self._get_conversations()
         conversations[conv_id] = conversation
@@ -115,7 +187,15 @@ class AgentManager:
     def delete_conversation(self, conversation_id: str) -> bool:
         conversations = self._get_conversations()
         if conversation_id in conversations:
-            conversations.pop(conversation_id)
+            removed = conversations.pop(conversation_id)
+            with self._vectorstore_lock:
+                self._vectorstores.pop(conversation_id, None)
+            self._vector_has_content.pop(conversation_id, None)
+            kv_store.delete_blobs([
+                self._file_text_key(entry["text_ref"])
+                for entry in removed.get("files", [])
+                if entry.get("text_ref")
+            ])
             self.update_context("conversations", conversations)
             return True
         return False
@@ -158,7 +238,7 @@ class AgentManager:
             title = conversation.get("title", "")
             if not title or title == self.DEFAULT_TITLE:
                 conversation["title"] = self._guess_conversation_title(content)
-        conversation["updated_at"] = now
+        self._touch(conversation)
         self.update_context("conversations", conversations)
 
     def add_conversation_file(
@@ -174,23 +254,20 @@ class AgentManager:
         conversation = conversations.get(conversation_id)
         if conversation is None:
             raise KeyError(f"Conversation not found: {conversation_id}")
+        file_id = str(uuid.uuid4())
+        kv_store.set_blob(self._file_text_key(file_id), (text or "")[:10000])
         file_entry = {
-            "id": str(uuid.uuid4()),
+            "id": file_id,
             "filename": filename,
             "path": path,
             "size_bytes": size_bytes,
             "uploaded_at": self._now(),
-            "text": (text or "")[:10000],
+            "text_ref": file_id,
         }
         conversation.setdefault("files", []).append(file_entry)
         # 전역 uploaded_files에도 정보 남겨두어 기존 로직 영향 최소화
-        uploaded = self.shared_context.setdefault("uploaded_files", [])
-        uploaded = [entry for entry in uploaded if entry.get("filename") != filename]
-        uploaded.append({"filename": filename, "path": path})
-        if len(uploaded) > 50:
-            uploaded = uploaded[-50:]
-        self.shared_context["uploaded_files"] = uploaded
-        conversation["updated_at"] = self._now()
+        self._remember_uploaded_file(filename, path)
+        self._touch(conversation)
         # 대화방 전용 Chroma에 즉시 임베딩 upsert
         try:
             self._upsert_conversation_embeddings(conversation_id, text, filename)
@@ -212,7 +289,7 @@ class AgentManager:
             report_data["created_at"] = self._now()
             
         conversation.setdefault("reports", []).append(report_data)
-        conversation["updated_at"] = self._now()
+        self._touch(conversation)
         self.update_context("conversations", conversations)
 
     def list_conversation_reports(self, conversation_id: str) -> List[Dict[str, Any]]:
@@ -238,40 +315,67 @@ class AgentManager:
         if not files:
             return ""
         # 개수만큼 분배해 너무 긴 텍스트 방지
-        slice_len = max_total_chars // len(files) if files else max_total_chars
+        slice_len = max_total_chars // len(files)
         if slice_len <= 0:
             slice_len = max_total_chars
-        contexts = []
+        buf = io.StringIO()
         for entry in files:
             text = (entry.get("text") or "")[:slice_len]
             if not text:
                 continue
-            contexts.append(f"[파일: {entry.get('filename')}]\n{text}")
-        return "\n\n".join(contexts)
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write("[파일: ")
+            buf.write(str(entry.get("filename")))
+            buf.write("]\n")
+            buf.write(text)
+        return buf.getvalue()
 
     def get_conversation_files_with_text(self, conversation_id: str) -> List[Dict[str, Any]]:
         conversation = self.get_conversation(conversation_id)
         if not conversation:
             return []
-        return conversation.get("files", [])
+        files = conversation.get("files", [])
+        # text_ref가 있는 항목만 본문을 한 번에 조회 (이전 형식은 text를 그대로 사용)
+        refs = [entry["text_ref"] for entry in files if entry.get("text_ref")]
+        texts = dict(zip(refs, kv_store.get_blobs([self._file_text_key(ref) for ref in refs])))
+        return [
+            {**entry, "text": texts.get(entry["text_ref"]) or ""} if entry.get("text_ref") else entry
+            for entry in files
+        ]
+
+    @staticmethod
+    def _file_text_key(file_id: str) -> str:
+        return f"{FILE_TEXT_KEY_PREFIX}{file_id}"
 
     def _get_conversation_vector_path(self, conversation_id: str) -> Path:
         return CONVERSATION_VECTOR_DIR / conversation_id
 
-    def _get_conversation_vectorstore(self, conversation_id: str) -> Chroma:
-        persist_dir = str(self._get_conversation_vector_path(conversation_id))
-        os.makedirs(persist_dir, exist_ok=True)
-        return Chroma(
-            collection_name=f"convo_{conversation_id}",
-            embedding_function=self._conv_embeddings,
-            persist_directory=persist_dir,
-        )
+    def _get_conversation_vectorstore(self, conversation_id: str) -> "Chroma":
+        from langchain_community.vectorstores import Chroma
+
+        with self._vectorstore_lock:
+            vectorstore = self._vectorstores.get(conversation_id)
+            if vectorstore is not None:
+                self._vectorstores.move_to_end(conversation_id)
+                return vectorstore
+            persist_dir = str(self._get_conversation_vector_path(conversation_id))
+            os.makedirs(persist_dir, exist_ok=True)
+            vectorstore = Chroma(
+                collection_name=f"convo_{conversation_id}",
+                embedding_function=get_embeddings(),
+                persist_directory=persist_dir,
+            )
+            self._vectorstores[conversation_id] = vectorstore
+            if len(self._vectorstores) > MAX_CACHED_VECTORSTORES:
+                self._vectorstores.popitem(last=False)
+            return vectorstore
 
     def _upsert_conversation_embeddings(self, conversation_id: str, text: str, filename: str):
         """대화방 전용 Chroma 컬렉션에 파일 청크를 업로드"""
         if not text:
             return
-        chunks = self._conv_splitter.split_text(text)
+        chunks = self._split_text(text)
         if not chunks:
             return
         vectorstore = self._get_conversation_vectorstore(conversation_id)
@@ -284,11 +388,29 @@ class AgentManager:
         ]
         ids = [f"{filename}-{uuid.uuid4()}" for _ in chunks]
         vectorstore.add_texts(texts=chunks, metadatas=metadatas, ids=ids)
+        self._vector_has_content[conversation_id] = True
+
+    def _split_text(self, text: str) -> List[str]:
+        digest = hashlib.blake2s(text.encode("utf-8")).hexdigest()
+        chunks = self._chunk_cache.get(digest)
+        if chunks is not None:
+            self._chunk_cache.move_to_end(digest)
+            return chunks
+        chunks = self._conv_splitter.split_text(text)
+        self._chunk_cache[digest] = chunks
+        if len(self._chunk_cache) > MAX_CACHED_SPLITS:
+            self._chunk_cache.popitem(last=False)
+        return chunks
 
     def retrieve_conversation_snippets(self, conversation_id: str, query: str, k: int = 4) -> List[str]:
         """대화방별 업로드 문서에서 쿼리와 유사한 청크를 검색"""
-        vector_path = self._get_conversation_vector_path(conversation_id)
-        if not vector_path.exists() or not any(vector_path.iterdir()):
+        has_content = self._vector_has_content.get(conversation_id)
+        if has_content is None:
+            # 서버 재시작 후 첫 조회 시에만 디스크를 확인하고 결과를 기억
+            vector_path = self._get_conversation_vector_path(conversation_id)
+            has_content = vector_path.exists() and any(vector_path.iterdir())
+            self._vector_has_content[conversation_id] = has_content
+        if not has_content:
             return []
         try:
             vectorstore = self._get_conversation_vectorstore(conversation_id)
@@ -300,9 +422,9 @@ class AgentManager:
 
     def _generate_title_with_llm(self, content: str) -> Optional[str]:
         try:
-            if self._title_llm is None:
-                # 짧은 제목만 필요하므로 낮은 temperature와 max_tokens 설정
-                self._title_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1, max_tokens=32)
+            from langchain_core.messages import SystemMessage, HumanMessage
+
+            llm = _title_llm_singleton()
             messages = [
                 SystemMessage(
                     content=(
@@ -312,7 +434,7 @@ class AgentManager:
                 ),
                 HumanMessage(content=content),
             ]
-            response = self._title_llm.invoke(messages)
+            response = llm.invoke(messages)
             title = (response.content or "").strip()
             if len(title) > 20:
                 title = title[:20] + "..."
@@ -344,7 +466,7 @@ class AgentManager:
 
     async def run_policy_agent(self, query: str) -> str:
         try:
-            result = policy_guideline_tool(query)
+            result = await policy_guideline_tool.ainvoke(query)
             self.update_context("policy_analysis", result)
             return result
         except Exception as exc:
@@ -376,6 +498,8 @@ class AgentManager:
 
     async def run_custom_agent(self, query: str, *, focus_area: Optional[str] = None, audience: Optional[str] = None) -> Dict[str, str]:
         """LangGraph 기반 파이프라인으로 4개 모듈을 동시에 실행"""
+        from src.workflows.custom_graph import run_langgraph_pipeline
+
         result = run_langgraph_pipeline(query, focus_area, audience)
         self.update_context("policy_analysis", result.get("policy"))
         self.update_context("regulation_updates", result.get("regulation"))
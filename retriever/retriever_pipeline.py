@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
@@ -21,6 +22,22 @@ DEFAULT_VECTOR_DIR = Path("vector_db/esg_all")
 DEFAULT_COLLECTION = "esg_all"
 DEFAULT_EMBEDDING_MODEL = "BAAI/bge-m3"
 
+_embeddings_cache: Dict[str, HuggingFaceEmbeddings] = {}
+_embeddings_lock = threading.Lock()
+
+
+def get_embeddings(model_name: str = DEFAULT_EMBEDDING_MODEL) -> HuggingFaceEmbeddings:
+    """모델명별로 임베딩 모델을 한 번만 로드해 재사용한다 (동시 첫 호출도 1회 로드)."""
+
+    embeddings = _embeddings_cache.get(model_name)
+    if embeddings is None:
+        with _embeddings_lock:
+            embeddings = _embeddings_cache.get(model_name)
+            if embeddings is None:
+                embeddings = HuggingFaceEmbeddings(model_name=model_name)
+                _embeddings_cache[model_name] = embeddings
+    return embeddings
+
 
 def load_vectorstore(
     persist_directory: Path | str = DEFAULT_VECTOR_DIR,
@@ -28,7 +45,7 @@ def load_vectorstore(
 ) -> Chroma:
     """벡터 구축 단계와 동일한 임베딩으로 저장된 Chroma를 불러온다."""
 
-    embeddings = HuggingFaceEmbeddings(model_name=model_name)
+    embeddings = get_embeddings(model_name)
     return Chroma(
         persist_directory=str(persist_directory),
         collection_name=DEFAULT_COLLECTION,
@@ -1,4 +1,10 @@
-COMPARE_PROMPT = """
+from __future__ import annotations
+
+
+def compare_prompt(policy_a: str, policy_b: str, context: str | None = None) -> str:
+    # 표준 근거 섹션은 출력 지시문 뒤에 붙여 한 번의 f-string으로 전체 프롬프트를 조립
+    evidence = "" if context is None else f"\n\n[표준 기반 근거]\n{context}"
+    return f"""
 당신은 글로벌 ESG 컴플라이언스 및 지속가능경영 전문 컨설턴트입니다.
 두 ESG 정책/문서를 심층 비교 분석하여 실무에 즉시 활용 가능한 GAP 분석 보고서를 작성하세요.
 
@@ -79,4 +85,4 @@ COMPARE_PROMPT = """
 위 7개 항목을 순서대로 작성하세요.
 표는 반드시 마크다운 표 형식을 사용하세요.
 문서에 해당 내용이 없으면 "해당 없음" 또는 "문서에 명시되지 않음"으로 표기하세요.
-"""
\ No newline at end of file
+{evidence}"""
\ No newline at end of file
@@ -1,4 +1,5 @@
-EVALUATE_PROMPT = """
+def evaluate_prompt(text: str) -> str:
+    return f"""
 당신은 ESG 정책 성숙도 평가 전문 컨설턴트입니다.
 아래 정책 문서를 체계적으로 평가하고, 실무 개선에 활용 가능한 평가 보고서를 작성하세요.
 
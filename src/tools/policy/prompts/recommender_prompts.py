@@ -1,4 +1,5 @@
-RECOMMEND_PROMPT = """
+def recommend_prompt(text: str) -> str:
+    return f"""
 당신은 ESG 정책 고도화 전문 컨설턴트입니다.
 아래 정책 문서를 분석하여 **경영진이 즉시 승인할 수 있는** 구체적 개선안을 제시하세요.
 
@@ -1,4 +1,10 @@
-SUMMARIZE_PROMPT = """
+from __future__ import annotations
+
+
+def summarize_prompt(text: str, context: str | None = None) -> str:
+    # 검색 근거는 문서 본문 바로 뒤에 붙여 한 번의 f-string으로 전체 프롬프트를 조립
+    evidence = "" if context is None else f"\n\n[관련 표준 근거]\n{context}"
+    return f"""
 당신은 ESG 정책·지침 분석 전문 컨설턴트입니다.
 주어진 문서를 **핵심만 추출**하여 의사결정자가 즉시 활용 가능한 형태로 요약하세요.
 
@@ -92,7 +98,7 @@ SUMMARIZE_PROMPT = """
 📄 분석 대상 문서
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-{text}
+{text}{evidence}
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 📊 출력
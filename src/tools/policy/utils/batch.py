@@ -0,0 +1,75 @@
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from openai import OpenAI
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _request_line(idx: int, prompt: str, body: Dict[str, Any]) -> str:
+    return json.dumps(
+        {
+            "custom_id": str(idx),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {**body, "messages": [{"role": "user", "content": prompt}]},
+        },
+        ensure_ascii=False,
+    )
+
+
+def run_chat_batch(
+    prompts: Sequence[str],
+    model: str,
+    temperature: Optional[float] = None,
+    poll_interval: float = 30.0,
+    timeout: Optional[float] = None,
+    client: Optional[OpenAI] = None,
+) -> List[str]:
+    """프롬프트 N개를 OpenAI Batch API 작업 1개로 제출하고 입력 순서대로 응답 본문을 반환.
+
+    대화형 응답이 필요 없는 일괄 평가/추천용 (완료까지 최대 24시간, 비용 50% 할인).
+    개별 요청 실패는 "[ERROR] ..." 문자열로 채운다.
+    """
+    if not prompts:
+        return []
+    client = client or OpenAI()
+    body: Dict[str, Any] = {"model": model}
+    if temperature is not None:
+        body["temperature"] = temperature
+
+    payload = "\n".join(_request_line(i, p, body) for i, p in enumerate(prompts))
+    input_file = client.files.create(file=("policy_batch.jsonl", payload.encode("utf-8")), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    started = time.monotonic()
+    while batch.status not in TERMINAL_STATUSES:
+        if timeout is not None and time.monotonic() - started > timeout:
+            raise TimeoutError(f"OpenAI batch {batch.id} did not finish within {timeout}s (status={batch.status})")
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"OpenAI batch {batch.id} ended with status={batch.status}")
+
+    results = ["[ERROR] 응답 없음"] * len(prompts)
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            idx = int(record["custom_id"])
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                error = record.get("error") or response.get("body", {}).get("error")
+                results[idx] = f"[ERROR] {error}"
+                continue
+            results[idx] = response["body"]["choices"][0]["message"]["content"]
+    return results
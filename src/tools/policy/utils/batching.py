@@ -0,0 +1,97 @@
+import asyncio
+import hashlib
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional
+
+MIN_BUCKET = 16
+
+
+def _bucket(length: int) -> int:
+    """토큰 길이를 2의 거듭제곱 버킷(16, 32, 64, ...)으로 올림"""
+    return max(MIN_BUCKET, 1 << max(0, length - 1).bit_length())
+
+
+class DynamicEmbedder:
+    """동시에 들어온 임베딩 요청을 짧은 시간 창(max_wait) 동안 모아 한 번의 embed_documents로 처리.
+
+    LangGraph 병렬 노드 등에서 질의가 동시에 들어오면 N번의 forward 대신 배치 forward 1회로 끝난다.
+    하나의 이벤트 루프 안에서만 사용해야 한다 (큐/Future가 루프에 묶임).
+    """
+
+    def __init__(self, embeddings: Any, max_batch: int = 32, max_wait: float = 0.01, cache_size: int = 4096):
+        self.embeddings = embeddings
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.cache_size = cache_size
+        self._queue: Optional["asyncio.Queue[tuple[str, asyncio.Future]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        # 같은 텍스트(예: 비교 화면에서 고정된 정책 A/B)는 forward 없이 이전 벡터 재사용 (SHA-256 키 LRU)
+        self._cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+
+    async def embed(self, text: str) -> List[float]:
+        key = hashlib.sha256(text.encode("utf-8")).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._consume())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        vector = await future
+
+        self._cache[key] = vector
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return vector
+
+    def _lengths(self, texts: List[str]) -> List[int]:
+        # 로컬 sentence-transformers 모델이면 실제 토크나이저로 길이 측정, 아니면 문자 수로 근사
+        tokenizer = getattr(getattr(self.embeddings, "_client", None), "tokenizer", None)
+        if tokenizer is None:
+            return [len(t) for t in texts]
+        return [len(ids) for ids in tokenizer(texts, add_special_tokens=True)["input_ids"]]
+
+    def _embed_bucketed(self, texts: List[str]) -> List[List[float]]:
+        """길이 버킷별로 따로 forward해 짧은 질의가 긴 질의 길이만큼 패딩되지 않도록 함"""
+        if len(texts) == 1:
+            return self.embeddings.embed_documents(texts)
+        buckets: Dict[int, List[int]] = defaultdict(list)
+        for idx, length in enumerate(self._lengths(texts)):
+            buckets[_bucket(length)].append(idx)
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        for indices in buckets.values():
+            for idx, vector in zip(indices, self.embeddings.embed_documents([texts[i] for i in indices])):
+                vectors[idx] = vector
+        return vectors
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        return list(await asyncio.gather(*(self.embed(t) for t in texts)))
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = await asyncio.to_thread(self._embed_bucketed, texts)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
@@ -0,0 +1,108 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray:
+    arr = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(arr)
+    return arr / norm if norm else arr
+
+
+class SemanticRetrieverCache:
+    """쿼리 임베딩의 코사인 유사도로 검색 결과를 재사용하는 LRU 캐시.
+
+    threshold 이상으로 유사한 이전 쿼리가 있으면 임베딩 검색(HNSW)을 건너뛰고
+    저장된 문서 리스트를 그대로 돌려준다.
+    """
+
+    def __init__(self, threshold: float = 0.97, maxsize: int = 1024):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._vectors: Optional[np.ndarray] = None  # (maxsize, dim) 정규화된 쿼리 벡터
+        self._last_used = np.zeros(maxsize, dtype=np.int64)
+        self._values: List[Any] = []
+        self._tick = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def lookup(self, vector: Sequence[float]) -> Optional[List[Any]]:
+        query = _normalize(vector)
+        with self._lock:
+            size = len(self._values)
+            if not size:
+                return None
+            sims = self._vectors[:size] @ query
+            idx = int(np.argmax(sims))
+            if sims[idx] < self.threshold:
+                return None
+            self._tick += 1
+            self._last_used[idx] = self._tick
+            return list(self._values[idx])
+
+    def add(self, vector: Sequence[float], value: List[Any]) -> None:
+        query = _normalize(vector)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.empty((self.maxsize, query.shape[0]), dtype=np.float32)
+            size = len(self._values)
+            if size < self.maxsize:
+                idx = size
+                self._values.append(list(value))
+            else:
+                # 가장 오래 사용되지 않은 슬롯을 덮어씀
+                idx = int(np.argmin(self._last_used))
+                self._values[idx] = list(value)
+            self._vectors[idx] = query
+            self._tick += 1
+            self._last_used[idx] = self._tick
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = None
+            self._values = []
+            self._last_used[:] = 0
+
+
+class TTLResponseCache:
+    """(모드, 정규화 질의) 완전 일치 키로 LLM 응답을 보관하는 TTL + LRU 캐시."""
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(mode: str, text: str) -> str:
+        normalized = " ".join(text.lower().split())
+        return hashlib.sha256(f"{mode}\0{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
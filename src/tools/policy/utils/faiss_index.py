@@ -0,0 +1,85 @@
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - optional dependency
+    faiss = None
+
+INDEX_FILE = "index.faiss"
+DOCS_FILE = "docs.jsonl"
+
+
+class FaissDocIndex:
+    """Chroma 컬렉션을 옮겨 담은 FAISS IVF-PQ 인덱스 + 문서 사이드 테이블.
+
+    벡터는 L2 정규화 후 내적(=코사인)으로 검색하며, 문서 본문/메타데이터는
+    인덱스의 행 번호 순서대로 docs.jsonl에 보관한다.
+    """
+
+    def __init__(self, index: Any, docs: List[Dict[str, Any]], nprobe: int = 32):
+        self.index = index
+        self.docs = docs
+        if hasattr(index, "nprobe"):
+            index.nprobe = nprobe
+
+    @classmethod
+    def load(cls, directory: str, nprobe: int = 32) -> Optional["FaissDocIndex"]:
+        """인덱스가 없거나 faiss가 설치되지 않았으면 None (Chroma 경로 사용)"""
+        path = Path(directory)
+        if faiss is None or not (path / INDEX_FILE).exists():
+            return None
+        index = faiss.read_index(str(path / INDEX_FILE))
+        with open(path / DOCS_FILE, encoding="utf-8") as f:
+            docs = [json.loads(line) for line in f]
+        return cls(index, docs, nprobe=nprobe)
+
+    def search(self, vectors: Sequence[Sequence[float]], k: int) -> List[List[Document]]:
+        query = np.asarray(vectors, dtype=np.float32)
+        faiss.normalize_L2(query)
+        _, ids = self.index.search(query, k)
+        return [
+            [
+                Document(page_content=self.docs[i]["text"], metadata=self.docs[i].get("metadata") or {})
+                for i in row
+                if i >= 0
+            ]
+            for row in ids
+        ]
+
+
+def build_ivfpq_index(embeddings: np.ndarray, m: int = 128, nbits: int = 8, nlist: Optional[int] = None) -> Any:
+    """IVF-PQ 인덱스 학습/구축. nlist는 지정하지 않으면 문서 수에 맞춰 4·√N (최대 4096)"""
+    if faiss is None:
+        raise ImportError("faiss가 설치되어 있지 않습니다. `pip install faiss-cpu`로 설치하세요.")
+    vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+    faiss.normalize_L2(vectors)
+    count, dim = vectors.shape
+    if count < (1 << nbits) * 4:
+        # PQ 코드북(2^nbits 중심)을 학습하기엔 문서가 너무 적음 → 정확 검색 인덱스
+        index = faiss.IndexFlatIP(dim)
+        index.add(vectors)
+        return index
+    if nlist is None:
+        nlist = max(1, min(4096, int(4 * math.sqrt(count))))
+    # PQ 코드북 학습에는 클러스터당 충분한 샘플이 필요하므로 문서 수가 적으면 nlist를 줄임
+    nlist = max(1, min(nlist, count // 39))
+    quantizer = faiss.IndexFlatIP(dim)
+    index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, nbits, faiss.METRIC_INNER_PRODUCT)
+    index.train(vectors)
+    index.add(vectors)
+    return index
+
+
+def save_index(directory: str, index: Any, docs: List[Dict[str, Any]]) -> None:
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    faiss.write_index(index, str(path / INDEX_FILE))
+    with open(path / DOCS_FILE, "w", encoding="utf-8") as f:
+        for doc in docs:
+            f.write(json.dumps(doc, ensure_ascii=False) + "\n")
@@ -1,10 +1,20 @@
 from __future__ import annotations
-from typing import Any
+import asyncio
+import operator
+import os
+import queue
+import re
+import threading
+from functools import lru_cache, reduce
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+import httpx
 
 # ---------------------------------
 # 0) RAG 구성
 # ---------------------------------
 from langchain_community.vectorstores import Chroma
+from langchain_core.documents import Document
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_openai import ChatOpenAI
 
@@ -12,10 +22,14 @@ from langchain_openai import ChatOpenAI
 # ============================================================
 # 1) PROMPTS (prompts 폴더에서 import)
 # ============================================================
-from src.tools.policy.prompts.summarizer_prompts import SUMMARIZE_PROMPT
-from src.tools.policy.prompts.comparator_prompts import COMPARE_PROMPT
-from src.tools.policy.prompts.evaluator_prompts import EVALUATE_PROMPT
-from src.tools.policy.prompts.recommender_prompts import RECOMMEND_PROMPT
+from src.tools.policy.prompts.summarizer_prompts import summarize_prompt
+from src.tools.policy.prompts.comparator_prompts import compare_prompt
+from src.tools.policy.prompts.evaluator_prompts import evaluate_prompt
+from src.tools.policy.prompts.recommender_prompts import recommend_prompt
+from src.tools.policy.utils.cache import SemanticRetrieverCache, TTLResponseCache
+from src.tools.policy.utils.batch import run_chat_batch
+from src.tools.policy.utils.batching import DynamicEmbedder
+from src.tools.policy.utils.faiss_index import FaissDocIndex
 
 
 
@@ -26,42 +40,203 @@ from src.tools.policy.prompts.recommender_prompts import RECOMMEND_PROMPT
 # -----------------------------
 # 임베딩 및 벡터 DB (Lazy Load)
 # -----------------------------
+RETRIEVER_K = 5
+# 경량 모델로 재임베딩한 저장소(vector_db/reembed_store.py)를 쓰려면 모델/경로/컬렉션을 함께 지정
+# 예) POLICY_EMBED_MODEL=sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2
+#     POLICY_VECTOR_DIR=vector_db/esg_all_small POLICY_COLLECTION=esg_all_small
+EMBED_MODEL_NAME = os.getenv("POLICY_EMBED_MODEL", "BAAI/bge-m3")
+VECTOR_DIR = os.getenv("POLICY_VECTOR_DIR", "vector_db/esg_all")
+COLLECTION_NAME = os.getenv("POLICY_COLLECTION", "esg_all")
+# TEI(text-embeddings-inference) 서버 주소가 지정되면 로컬 PyTorch 대신 HTTP로 임베딩 (FP16/ONNX 추론은 TEI가 담당)
+EMBED_TEI_URL = os.getenv("POLICY_EMBED_TEI_URL")
+# vector_db/build_faiss_index.py로 만든 IVF-PQ 인덱스가 있으면 Chroma 대신 사용
+FAISS_INDEX_DIR = f"{VECTOR_DIR}_faiss"
+_vectordb = None
 _retriever = None
+# 동시 첫 호출에서 bge-m3(~2GB)가 여러 번 로드되지 않도록 초기화를 직렬화
+_vectordb_lock = threading.Lock()
+
+def _build_embeddings():
+    if EMBED_TEI_URL:
+        from langchain_huggingface import HuggingFaceEndpointEmbeddings
+        return HuggingFaceEndpointEmbeddings(model=EMBED_TEI_URL)
+
+    model_kwargs = {}
+    try:
+        import torch
+        if torch.cuda.is_available():
+            # GPU에서는 FP16으로 로드해 메모리 대역폭/연산량을 절반으로
+            model_kwargs = {"device": "cuda", "model_kwargs": {"torch_dtype": torch.float16}}
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+    return HuggingFaceEmbeddings(model_name=EMBED_MODEL_NAME, model_kwargs=model_kwargs)
+
+
+def get_vectordb() -> Chroma:
+    global _vectordb
+    if _vectordb is None:
+        with _vectordb_lock:
+            if _vectordb is None:
+                try:
+                    print("⚙️ [PolicyTool] Loading Embeddings & VectorDB...")
+                    embedding_model = _build_embeddings()
+                    _vectordb = Chroma(
+                        persist_directory=VECTOR_DIR,
+                        embedding_function=embedding_model,
+                        collection_name=COLLECTION_NAME
+                    )
+                except Exception as e:
+                    print(f"❌ [PolicyTool] Initialization failed: {e}")
+                    raise
+    return _vectordb
+
 
 def get_retriever():
     global _retriever
     if _retriever is None:
-        try:
-            print("⚙️ [PolicyTool] Loading Embeddings & VectorDB...")
-            embedding_model = HuggingFaceEmbeddings(model_name="BAAI/bge-m3")
-            vectordb = Chroma(
-                persist_directory="vector_db/esg_all",
-                embedding_function=embedding_model,
-                collection_name="esg_all"
-            )
-            _retriever = vectordb.as_retriever(search_kwargs={"k": 5})
-        except Exception as e:
-            print(f"❌ [PolicyTool] Initialization failed: {e}")
-            raise
+        vectordb = get_vectordb()
+        with _vectordb_lock:
+            if _retriever is None:
+                _retriever = vectordb.as_retriever(search_kwargs={"k": RETRIEVER_K})
     return _retriever
 
 
+@lru_cache(maxsize=1)
+def get_embedder() -> DynamicEmbedder:
+    """동시 질의 임베딩을 10ms 창 안에서 묶어 처리 (정책 전용 이벤트 루프에서만 사용)"""
+    return DynamicEmbedder(get_vectordb().embeddings, max_batch=32, max_wait=0.01)
+
+
+@lru_cache(maxsize=1)
+def get_faiss_index() -> Optional[FaissDocIndex]:
+    index = FaissDocIndex.load(FAISS_INDEX_DIR)
+    if index is not None:
+        print(f"⚙️ [PolicyTool] Using FAISS index ({len(index.docs)} chunks)")
+    return index
+
+
+# 같은 모드·같은 질의(대소문자/공백 정규화)는 1시간 동안 LLM 호출 없이 이전 응답 반환
+_response_cache = TTLResponseCache(maxsize=2048, ttl=3600)
+
+# 거의 같은 질의(코사인 ≥ 0.97)는 벡터 검색 없이 이전 결과 재사용
+_semantic_cache = SemanticRetrieverCache(threshold=0.97, maxsize=1024)
+
+# 완전히 같은 질의(정규화 기준)는 임베딩 계산도 건너뛰고 바로 검색 결과 반환
+_retrieval_cache = TTLResponseCache(maxsize=1024, ttl=3600)
+
+
+def _search_chroma(vectors: List[List[float]]) -> List[List[Document]]:
+    res = get_vectordb()._collection.query(
+        query_embeddings=vectors,
+        n_results=RETRIEVER_K,
+        include=["documents", "metadatas"],
+    )
+    return [
+        [Document(page_content=text, metadata=meta or {}) for text, meta in zip(texts, metas)]
+        for texts, metas in zip(res["documents"], res["metadatas"])
+    ]
+
+
+def _search_backend(vectors: List[List[float]]) -> List[List[Document]]:
+    index = get_faiss_index()
+    if index is not None:
+        return index.search(vectors, RETRIEVER_K)
+    return _search_chroma(vectors)
+
+
+async def _asearch_by_vector(vector):
+    return (await _asearch_by_vectors([vector]))[0]
+
+
+async def _asearch_by_vectors(vectors: Sequence[Sequence[float]]) -> List[List[Document]]:
+    """여러 질의 벡터를 캐시 조회 후, 미스분만 한 번의 배치 쿼리(FAISS 또는 Chroma)로 검색"""
+    results: List[Optional[List[Document]]] = [_semantic_cache.lookup(v) for v in vectors]
+    misses = [i for i, r in enumerate(results) if r is None]
+    if misses:
+        found = await asyncio.to_thread(_search_backend, [list(vectors[i]) for i in misses])
+        for i, docs in zip(misses, found):
+            _semantic_cache.add(vectors[i], docs)
+            results[i] = docs
+    return results
+
+
+async def aretrieve(text: str):
+    """완전 일치 캐시 → 질의 임베딩 → 시맨틱 캐시 → (미스 시) 벡터 검색"""
+    key = TTLResponseCache.make_key("retrieve", text)
+    cached = _retrieval_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    vector = await get_embedder().embed(text)
+    docs = await _asearch_by_vector(vector)
+    _retrieval_cache.set(key, list(docs))
+    return docs
+
+
+@lru_cache(maxsize=1)
+def get_llm() -> ChatOpenAI:
+    """Summarizer/Comparator/Evaluator/Recommender가 공유하는 LLM (HTTP 커넥션 풀 재사용)"""
+    return ChatOpenAI(
+        model="gpt-4o-mini",
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        ),
+        # ainvoke/astream 경로용 비동기 풀: 항상 정책 전용 루프에서만 사용되므로 루프 간 공유 문제 없음
+        http_async_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60,
+        ),
+    )
+
+
+# -----------------------------
+# 비동기 실행용 전용 이벤트 루프
+# -----------------------------
+# 비동기 LLM/검색 호출은 항상 이 루프에서 실행해 공유 클라이언트가 여러 루프에 걸치지 않도록 함
+_T = TypeVar("_T")
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="policy-tool-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def _run_sync(coro: Awaitable[_T]) -> _T:
+    """동기 진입점에서 코루틴을 전용 루프에 넘기고 결과를 기다림"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def _run_async(coro: Awaitable[_T]) -> _T:
+    """호출자 이벤트 루프를 막지 않고 코루틴을 전용 루프에서 실행한 결과를 await"""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_loop()))
+
+
 
 # ============================================================
 # 2) Summarizer
 # ============================================================
 class PolicySummarizer:
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o-mini")
+        self.llm = get_llm()
 
     def summarize(self, text: str):
-        retriever = get_retriever()
-        related_docs = retriever.invoke(text)
-        context = "\n\n".join([d.page_content for d in related_docs])
+        return _run_sync(self.asummarize(text))
 
-        prompt = SUMMARIZE_PROMPT.format(text=text + "\n\n[관련 표준 근거]\n" + context)
+    async def asummarize(self, text: str):
+        return await self.llm.ainvoke(await self.abuild_prompt(text))
+
+    async def abuild_prompt(self, text: str) -> str:
+        related_docs = await aretrieve(text)
+        context = "\n\n".join([d.page_content for d in related_docs])
 
-        return self.llm.invoke(prompt)
+        return summarize_prompt(text, context=context)
 
 
 # ============================================================
@@ -69,19 +244,24 @@ class PolicySummarizer:
 # ============================================================
 class PolicyComparator:
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o-mini")
+        self.llm = get_llm()
 
     def compare(self, a: str, b: str):
-        retriever = get_retriever()
-        context_a = retriever.invoke(a)
-        context_b = retriever.invoke(b)
+        return _run_sync(self.acompare(a, b))
 
-        context = "\n\n".join([d.page_content for d in context_a + context_b])
+    async def acompare(self, a: str, b: str):
+        return await self.llm.ainvoke(await self.abuild_prompt(a, b))
 
-        prompt = COMPARE_PROMPT.format(policy_a=a, policy_b=b)
-        prompt += "\n\n[표준 기반 근거]\n" + context
+    async def abuild_prompt(self, a: str, b: str) -> str:
+        # 두 문서를 한 번의 배치(bge-m3 forward 1회)로 임베딩하고, 벡터 검색도 한 번의 배치 쿼리로 수행
+        vectors = await get_embedder().embed_many([a, b])
+        context_a, context_b = await _asearch_by_vectors(vectors)
 
-        return self.llm.invoke(prompt)
+        # A/B가 같은 표준 청크(GRI/SASB 등)를 공유하는 경우가 많아 본문 기준으로 중복 제거 (순서 유지)
+        unique_contents = dict.fromkeys(d.page_content for d in context_a + context_b)
+        context = "\n\n".join(unique_contents)
+
+        return compare_prompt(policy_a=a, policy_b=b, context=context)
 
 
 # ============================================================
@@ -89,10 +269,13 @@ class PolicyComparator:
 # ============================================================
 class PolicyEvaluator:
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o-mini")
+        self.llm = get_llm()
 
     def evaluate(self, text: str):
-        return self.llm.invoke(EVALUATE_PROMPT.format(text=text))
+        return _run_sync(self.aevaluate(text))
+
+    async def aevaluate(self, text: str):
+        return await self.llm.ainvoke(evaluate_prompt(text=text))
 
 
 # ============================================================
@@ -100,10 +283,66 @@ class PolicyEvaluator:
 # ============================================================
 class PolicyRecommender:
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o-mini")
+        self.llm = get_llm()
 
     def recommend(self, text: str):
-        return self.llm.invoke(RECOMMEND_PROMPT.format(text=text))
+        return _run_sync(self.arecommend(text))
+
+    async def arecommend(self, text: str):
+        return await self.llm.ainvoke(recommend_prompt(text=text))
+
+
+# 모드별 핸들러는 프로세스당 1개만 생성해 재사용
+@lru_cache(maxsize=1)
+def get_summarizer() -> PolicySummarizer:
+    return PolicySummarizer()
+
+
+@lru_cache(maxsize=1)
+def get_comparator() -> PolicyComparator:
+    return PolicyComparator()
+
+
+@lru_cache(maxsize=1)
+def get_evaluator() -> PolicyEvaluator:
+    return PolicyEvaluator()
+
+
+@lru_cache(maxsize=1)
+def get_recommender() -> PolicyRecommender:
+    return PolicyRecommender()
+
+
+async def _acompare_split(text: str) -> Any:
+    if "|" not in text:
+        return "비교하려면 '문서A | 문서B' 형식으로 입력하세요."
+    a, b = [t.strip() for t in text.split("|", 1)]
+    return await get_comparator().acompare(a, b)
+
+
+# 모드 → 핸들러 디스패치 테이블 (핸들러 객체는 첫 호출 시 생성되는 싱글톤)
+_MODE_HANDLERS: Dict[str, Callable[[str], Awaitable[Any]]] = {
+    "summarize": lambda text: get_summarizer().asummarize(text),
+    "compare": _acompare_split,
+    "evaluate": lambda text: get_evaluator().aevaluate(text),
+    "recommend": lambda text: get_recommender().arecommend(text),
+}
+
+
+def _compile_keywords(keys: Iterable[str]) -> "re.Pattern[str]":
+    """키워드 집합을 하나의 정규식으로 컴파일 (lookahead로 겹치는 위치의 키워드도 모두 탐지)"""
+    alternation = "|".join(re.escape(k) for k in sorted(set(keys), key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+def _first_label(pattern: "re.Pattern[str]", labels: Dict[str, str], priority: Dict[str, int], text: str) -> Optional[str]:
+    """text에 등장한 키워드의 라벨 중 우선순위가 가장 높은 것을 반환"""
+    found = {labels[m.group(1)] for m in pattern.finditer(text)}
+    return min(found, key=priority.__getitem__) if found else None
+
+
+# 스트리밍 종료 표시
+_STREAM_END = object()
 
 
 # ============================================================
@@ -129,58 +368,164 @@ class PolicyTool:
         "ISSB": ["issb", "ifrs s1", "ifrs s2"],
     }
 
+    # 우선순위 순서 (앞에 있을수록 우선)
+    MODE_KEYWORDS = {
+        "compare": ["비교", "compare"],
+        "evaluate": ["평가", "evaluate"],
+        "recommend": ["추천", "개선", "recommend"],
+    }
+
+    # 키워드 탐지용 정규식은 클래스 로드 시 한 번만 컴파일
+    _KEYWORD_RE = _compile_keywords(keywords)
+    _STANDARD_RE = _compile_keywords(k for keys in STANDARD_KEYWORDS.values() for k in keys)
+    _STANDARD_LABELS = {k: std for std, keys in STANDARD_KEYWORDS.items() for k in keys}
+    _STANDARD_PRIORITY = {std: i for i, std in enumerate(STANDARD_KEYWORDS)}
+    _MODE_RE = _compile_keywords(k for keys in MODE_KEYWORDS.values() for k in keys)
+    _MODE_LABELS = {k: mode for mode, keys in MODE_KEYWORDS.items() for k in keys}
+    _MODE_PRIORITY = {mode: i for i, mode in enumerate(MODE_KEYWORDS)}
+
     def matches(self, query: str) -> bool:
-        text = query.lower()
-        return any(k in text for k in self.keywords)
+        return self._KEYWORD_RE.search(query.lower()) is not None
 
     def detect_standard(self, text: str) -> str:
-        t = text.lower()
-        for std, keys in self.STANDARD_KEYWORDS.items():
-            if any(k in t for k in keys):
-                return std
-        return "UNKNOWN"
+        label = _first_label(self._STANDARD_RE, self._STANDARD_LABELS, self._STANDARD_PRIORITY, text.lower())
+        return label or "UNKNOWN"
 
     def detect_mode(self, text: str) -> str:
-        t = text.lower()
+        label = _first_label(self._MODE_RE, self._MODE_LABELS, self._MODE_PRIORITY, text.lower())
+        return label or "summarize"
 
-        if "비교" in t or "compare" in t:
-            return "compare"
-        if "평가" in t or "evaluate" in t:
-            return "evaluate"
-        if "추천" in t or "개선" in t or "recommend" in t:
-            return "recommend"
-        return "summarize"
+    def _detect_all(self, lowered: str) -> tuple[str, str]:
+        """이미 소문자화된 질의에서 (기준, 모드)를 함께 탐지 (run 경로에서 lower()를 1회만 수행)"""
+        standard = _first_label(self._STANDARD_RE, self._STANDARD_LABELS, self._STANDARD_PRIORITY, lowered)
+        mode = _first_label(self._MODE_RE, self._MODE_LABELS, self._MODE_PRIORITY, lowered)
+        return standard or "UNKNOWN", mode or "summarize"
 
     def run_mode(self, mode: str, text: str) -> Any:
+        return _run_sync(self.arun_mode(mode, text))
+
+    async def arun_mode(self, mode: str, text: str) -> Any:
+        cache_key = _response_cache.make_key(mode, text)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = await self._arun_mode_uncached(mode, text)
+        if not isinstance(result, str):
+            # 입력 형식 안내/오류 문자열이 아닌 LLM 응답만 캐시
+            _response_cache.set(cache_key, result)
+        return result
+
+    async def _abuild_prompt(self, mode: str, text: str) -> str:
+        """모드별 프롬프트 조립 (스트리밍 경로용; 검색 단계까지 포함)"""
         if mode == "summarize":
-            return PolicySummarizer().summarize(text)
-        elif mode == "compare":
-            if "|" not in text:
-                return "비교하려면 '문서A | 문서B' 형식으로 입력하세요."
+            return await get_summarizer().abuild_prompt(text)
+        if mode == "compare":
             a, b = [t.strip() for t in text.split("|", 1)]
-            return PolicyComparator().compare(a, b)
-        elif mode == "evaluate":
-            return PolicyEvaluator().evaluate(text)
-        elif mode == "recommend":
-            return PolicyRecommender().recommend(text)
-        return f"[ERROR] Unknown mode: {mode}"
+            return await get_comparator().abuild_prompt(a, b)
+        if mode == "evaluate":
+            return evaluate_prompt(text=text)
+        return recommend_prompt(text=text)
+
+    async def _arun_mode_uncached(self, mode: str, text: str) -> Any:
+        handler = _MODE_HANDLERS.get(mode)
+        if handler is None:
+            return f"[ERROR] Unknown mode: {mode}"
+        return await handler(text)
 
     def run(self, state):
+        return _run_sync(self._arun(state))
+
+    async def arun(self, state):
+        """비동기 진입점: 호출자 루프는 검색/LLM 대기 동안 다른 작업을 처리할 수 있음"""
+        return await _run_async(self._arun(state))
+
+    async def _arun(self, state):
+        # 정책 전용 이벤트 루프에서 실행됨
         query = state["query"]
 
-        standard = self.detect_standard(query)
+        standard, mode = self._detect_all(query.lower())
         base_info = f"[감지된 기준: {standard}]"
 
-        mode = self.detect_mode(query)
+        result = await self.arun_mode(mode, query)
 
-        result = self.run_mode(mode, query)
-        
         # [Fix] AIMessage 객체가 반환될 경우 content만 추출
         if hasattr(result, "content"):
             result = result.content
 
         return base_info + "\n\n" + result
 
+    # OpenAI Batch API로 일괄 처리할 수 있는 모드 (검색 없이 프롬프트만으로 완결)
+    BULK_PROMPTS = {"evaluate": evaluate_prompt, "recommend": recommend_prompt}
+
+    def bulk(self, mode: str, texts: List[str], *, poll_interval: float = 30.0, timeout: Optional[float] = None) -> List[str]:
+        """여러 정책을 한 번의 OpenAI Batch 작업으로 평가/추천 (비대화형 일괄 감사용, 결과는 입력 순서)"""
+        build = self.BULK_PROMPTS.get(mode)
+        if build is None:
+            raise ValueError(f"bulk()는 {sorted(self.BULK_PROMPTS)} 모드만 지원합니다: {mode}")
+        llm = get_llm()
+        return run_chat_batch(
+            [build(text=t) for t in texts],
+            model=llm.model_name,
+            temperature=llm.temperature,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
+    async def _astream_into(self, state, emit: Callable[[str], None]) -> None:
+        # 정책 전용 이벤트 루프에서 실행되며, 토큰이 도착하는 대로 emit으로 넘김
+        query = state["query"]
+        standard, mode = self._detect_all(query.lower())
+        emit(f"[감지된 기준: {standard}]\n\n")
+
+        cache_key = _response_cache.make_key(mode, query)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            emit(getattr(cached, "content", cached))
+            return
+        if mode == "compare" and "|" not in query:
+            emit("비교하려면 '문서A | 문서B' 형식으로 입력하세요.")
+            return
+
+        chunks = []
+        async for chunk in get_llm().astream(await self._abuild_prompt(mode, query)):
+            chunks.append(chunk)
+            if chunk.content:
+                emit(chunk.content)
+        if chunks:
+            # 조각을 합친 메시지를 캐시해 이후 run()/stream() 호출과 공유
+            _response_cache.set(cache_key, reduce(operator.add, chunks))
+
+    async def astream(self, data: Any) -> AsyncIterator[str]:
+        """결과를 LLM 토큰 단위로 흘려보내는 비동기 제너레이터 (첫 토큰까지의 지연만 체감)"""
+        state = self._normalize_state(data)
+        loop = asyncio.get_running_loop()
+        chunks: "asyncio.Queue[Any]" = asyncio.Queue()
+
+        def emit(item: Any) -> None:
+            loop.call_soon_threadsafe(chunks.put_nowait, item)
+
+        future = asyncio.run_coroutine_threadsafe(self._astream_into(state, emit), _get_loop())
+        future.add_done_callback(lambda _: emit(_STREAM_END))
+        try:
+            while (item := await chunks.get()) is not _STREAM_END:
+                yield item
+            future.result()
+        finally:
+            future.cancel()
+
+    def stream(self, data: Any) -> Iterator[str]:
+        """astream의 동기 버전"""
+        state = self._normalize_state(data)
+        chunks: "queue.Queue[Any]" = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(self._astream_into(state, chunks.put), _get_loop())
+        future.add_done_callback(lambda _: chunks.put(_STREAM_END))
+        try:
+            while (item := chunks.get()) is not _STREAM_END:
+                yield item
+            future.result()
+        finally:
+            future.cancel()
+
     def _normalize_state(self, data: Any) -> dict:
         """허용된 입력(str 또는 dict)을 LangGraph 상태 형태로 변환"""
         if isinstance(data, str):
@@ -199,6 +544,9 @@ class PolicyTool:
         # LangChain 호환을 위해 config 인자를 허용하지만 현재는 미사용
         return self.__call__(data)
 
+    async def ainvoke(self, data: Any, *, config: Any | None = None) -> str:
+        return await self.arun(self._normalize_state(data))
+
 
         
 # Graph/LangGraph에서 import할 실제 인스턴스
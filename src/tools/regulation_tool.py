@@ -1,14 +1,53 @@
 import os
+import re
 import time
 import json
-import schedule
+import hashlib
+import heapq
+import tempfile
+import atexit
+import asyncio
+import multiprocessing
+import threading
+import weakref
 import requests
-import numpy as np
 import fitz  # PyMuPDF
+import httpx
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Iterator, List, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
+try:
+    import lxml.html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency (없으면 Selenium 경로 사용)
+    lxml_html = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency (없으면 stdlib json)
+    orjson = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # pragma: no cover - optional dependency (없으면 URL/본문 앞부분 완전 일치만 제거)
+    MinHash = MinHashLSH = None
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency (없으면 문자 수로 자름)
+    tiktoken = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency (없으면 다운로드 폴더 폴링)
+    FileSystemEventHandler = object
+    Observer = None
+
 # Selenium (브라우저 제어용)
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -16,6 +55,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 try:
     from webdriver_manager.core.utils import ChromeType
@@ -27,12 +67,13 @@ except ImportError:  # Older webdriver_manager 버전 대응
 # LangChain & AI
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
-from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
+from langchain_core.messages import SystemMessage
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from sklearn.metrics.pairwise import cosine_similarity
 
 # 1. 환경 변수 로드
 load_dotenv()
@@ -43,8 +84,15 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 DOWNLOAD_DIR = os.path.join(DATA_DIR, "domestic")
 HISTORY_DIR = os.path.join(DATA_DIR, "crawling")
 HISTORY_FILE = os.path.join(HISTORY_DIR, "crawl_history.json")
+# 리포트의 다운로드 링크 (백엔드가 DOWNLOAD_DIR을 /static/domestic으로 서빙)
+DOWNLOAD_LINK_TEMPLATE = "[다운로드](http://localhost:8000/static/domestic/{})"
 LAST_CRAWL_FILE = os.path.join(HISTORY_DIR, "last_crawl.json")
 VECTOR_DB_DIR = os.path.join(BASE_DIR, "vector_db", "esg_all")  # 벡터DB 저장 경로
+# ChromeDriverManager가 찾은 드라이버 경로 캐시 (1주일마다 버전 재확인)
+DRIVER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "regulation_monitor", "chromedriver_path.txt")
+DRIVER_PATH_MAX_AGE = 7 * 24 * 3600
+# 문서 미리보기 텍스트 디스크 캐시 (다운로드 폴더에 두면 새 다운로드 감지에 섞이므로 별도 경로)
+PREVIEW_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "regulation_monitor", "previews")
 
 # [변경] 모니터링 타겟 목록
 # law.go.kr은 별도 로직으로 처리하기 위해 type을 구분하거나 URL로 식별
@@ -69,6 +117,266 @@ MINISTRY_TARGETS = [
     }
 ]
 
+# 정적 HTML 게시판은 브라우저 없이 HTTP로 직접 수집 (JS 링크 게시판만 Selenium 사용)
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+HTTP_TIMEOUT = 20
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+NEWS_MAX_RESULTS = 5
+# monitor_all에서 사용자 질의와 함께 항상 검색하는 뉴스 질의
+NEWS_QUERIES = ("ESG 공시 의무화", "환경부 입법예고", "중대재해처벌법 개정")
+# 유사 기사 제거 (MinHash LSH): 자카드 유사도 임계값 / 순열 수 / 단어 shingle 길이
+NEWS_DEDUP_THRESHOLD = 0.8
+NEWS_MINHASH_PERM = 128
+NEWS_SHINGLE_SIZE = 5
+# 같은 서버에 동시에 보낼 첨부 다운로드 수 / 스트리밍 쓰기 단위
+DOWNLOAD_LIMIT_PER_HOST = 4
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+ATTACHMENT_NAME_RE = re.compile(r'[^\\/:*?"<>|\r\n]+?\.(?:pdf|hwp|docx?)', re.IGNORECASE)
+
+# 보고서 게시판 (GMI: 상위 3건, FSC: 1~3페이지 중 키워드 포함 게시글)
+GMI_LIST_URL = "https://www.gmi.go.kr/np/boardList.do?menuCd=2090&seCd=2"
+FSC_BASE_URL = "https://www.fsc.go.kr/no010101"
+FSC_KEYWORDS = ["ESG", "공시", "지속가능", "녹색", "기후", "택소노미"]
+
+
+def _has_class(name: str) -> str:
+    """CSS '.name'에 해당하는 XPath 조건 (cssselect 없이 lxml만 사용)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _parse_html(html: bytes, base_url: str):
+    # bytes로 받아야 XML 인코딩 선언이 있는 문서도 lxml이 직접 디코딩 (str이면 ValueError)
+    tree = lxml_html.fromstring(html)
+    tree.make_links_absolute(base_url)
+    return tree
+
+
+def _is_http_link(href: Optional[str]) -> bool:
+    return bool(href) and href.startswith(("http://", "https://"))
+
+
+def _page_text(page, flags: Optional[int] = None) -> str:
+    # flags=None이면 PyMuPDF 기본값(합자/공백 보존), 정렬(sort)은 하지 않음
+    if flags is None:
+        return page.get_text("text", sort=False)
+    return page.get_text("text", sort=False, flags=flags)
+
+
+def _extract_page_range(file_path: str, start: int, stop: int, flags: Optional[int] = None) -> str:
+    """PDF의 [start, stop) 페이지 텍스트 (프로세스 풀 작업 단위 - 워커마다 문서를 따로 엶)"""
+    with fitz.open(file_path) as doc:
+        return "".join(_page_text(doc[i], flags) for i in range(start, min(stop, doc.page_count)))
+
+
+def _iter_pdf_text(file_path: str, max_pages: Optional[int] = None, flags: Optional[int] = None) -> Iterator[str]:
+    """PDF 텍스트를 앞에서부터 조금씩 생성. 페이지 수에 따라 추출 방식을 고름
+
+    - PDF_BATCH_MAX_PAGES 이하: 한 번에 읽어 문자열 1개로 반환
+    - PARALLEL_PDF_MIN_PAGES 미만: 페이지 단위로 생성 (메모리 = 페이지 1장)
+    - 그 이상: 페이지 구간을 여러 프로세스로 나눠 추출해 구간 단위로 생성
+    """
+    with fitz.open(file_path) as doc:
+        page_count = doc.page_count if max_pages is None else min(doc.page_count, max_pages)
+        if page_count <= PDF_BATCH_MAX_PAGES:
+            yield "".join(_page_text(doc[i], flags) for i in range(page_count))
+            return
+        if page_count < PARALLEL_PDF_MIN_PAGES:
+            for i in range(page_count):
+                yield _page_text(doc[i], flags)
+            return
+
+    # PyMuPDF는 스레드 안전하지 않고 get_text 중 GIL을 놓지 않으므로 스레드 대신 프로세스로 분할
+    workers = min(os.cpu_count() or 1, PDF_MAX_WORKERS)
+    pages_per_task = min(PDF_MAX_PAGES_PER_TASK, max(PDF_MIN_PAGES_PER_TASK, -(-page_count // workers)))
+    starts = list(range(0, page_count, pages_per_task))
+    # 백엔드 프로세스는 여러 스레드(uvicorn, 이벤트 루프, 임베딩 모델)를 돌리므로 fork 대신 spawn으로 워커 생성
+    # (fork는 다른 스레드가 잡고 있던 락을 복사해 자식이 멈출 수 있음)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        yield from pool.map(
+            _extract_page_range,
+            [file_path] * len(starts),
+            starts,
+            [start + pages_per_task for start in starts],
+            [flags] * len(starts),
+        )
+
+
+def _read_pdf_text(file_path: str, max_pages: Optional[int] = None, flags: Optional[int] = None) -> str:
+    return "".join(_iter_pdf_text(file_path, max_pages=max_pages, flags=flags))
+
+
+@lru_cache(maxsize=128)
+def _extract_preview_cached(file_path: str, mtime_ns: int, max_pages: int) -> str:
+    """(경로, 수정 시각, 페이지 수) 기준 미리보기 캐시. 메모리에 없으면 디스크 캐시 → 원본 파싱 순
+
+    읽기 실패는 예외로 올려 보내 캐시되지 않도록 함
+    """
+    digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    cache_path = os.path.join(PREVIEW_CACHE_DIR, f"{digest}-{mtime_ns}-{max_pages}.txt")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    if file_path.lower().endswith('.pdf'):
+        text_preview = _read_pdf_text(file_path, max_pages=max_pages, flags=PREVIEW_TEXT_FLAGS)
+    elif file_path.lower().endswith('.txt'):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read(3000)  # 앞부분 3000자 (파싱 비용이 없어 디스크 캐시 생략)
+    else:
+        return "(지원되지 않는 파일 형식입니다)"
+
+    try:
+        os.makedirs(PREVIEW_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"  # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text_preview)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️ 미리보기 캐시 저장 실패: {e}")
+    return text_preview
+
+
+# 클라이언트(= asyncio.run 1회)별 호스트 세마포어 - 세마포어가 이벤트 루프에 묶이므로 전역으로 두지 않음
+_host_slots: "weakref.WeakKeyDictionary[httpx.AsyncClient, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _host_slot(client: httpx.AsyncClient, url: str) -> asyncio.Semaphore:
+    slots = _host_slots.setdefault(client, {})
+    host = urlsplit(url).netloc
+    if host not in slots:
+        slots[host] = asyncio.Semaphore(DOWNLOAD_LIMIT_PER_HOST)
+    return slots[host]
+
+
+# 받는 중인 첨부의 최종 경로 - 같은 이름의 첨부를 동시에 받아도 서로 덮어쓰지 않도록 선점
+_claimed_downloads: set = set()
+_claimed_downloads_lock = threading.Lock()
+
+
+def _claim_download_path(f_name: str) -> str:
+    """DOWNLOAD_DIR에서 기존 파일/다른 다운로드와 겹치지 않는 경로를 골라 선점 ("이름 (1).pdf" 형식)"""
+    stem, ext = os.path.splitext(f_name)
+    with _claimed_downloads_lock:
+        candidate, n = os.path.join(DOWNLOAD_DIR, f_name), 1
+        while candidate in _claimed_downloads or os.path.exists(candidate):
+            candidate = os.path.join(DOWNLOAD_DIR, f"{stem} ({n}){ext}")
+            n += 1
+        _claimed_downloads.add(candidate)
+        return candidate
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except Exception as e:
+        print(f"⚠️ 토크나이저 로드 실패, 문자 수 기준으로 자릅니다: {e}")
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """text를 max_tokens 토큰 이내로 자름 (tiktoken이 없으면 토큰당 약 2자로 근사)"""
+    encoding = _get_encoding() if tiktoken else None
+    if encoding is None:
+        return text[:max_tokens * 2]
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+
+def _none_on_error(result, source_name: str):
+    """gather(return_exceptions=True) 결과가 예외면 None(→ Selenium으로 재시도)으로 바꿈"""
+    if isinstance(result, Exception):
+        print(f"   ↪️ [{source_name}] HTTP 수집 실패 → 브라우저로 재시도: {result}")
+        return None
+    return result
+
+
+async def _fetch_html(client: httpx.AsyncClient, url: str) -> bytes:
+    response = await client.get(url)
+    response.raise_for_status()
+    return response.content
+
+
+# 문서 중요도 판정 기준 (단일/일괄 판정 프롬프트 공통)
+ANALYSIS_CRITERIA = """
+        [판단 기준 - 중요 (High Score 7~10)]
+        - 건설 현장 안전, 중대재해처벌법 관련 사항
+        - 폐기물 관리, 탄소 배출, 대기/수질 오염 등 건설 환경 규제
+        - 하도급 공정거래, 협력사 지원 등 공급망 ESG
+        - 법률/시행령 개정안, 입법예고, 처벌 기준 강화
+        
+        [판단 기준 - 제외/낮음 (Score 1~3)]
+        - **야생생물/동물 보호** (건설 현장 환경영향평가와 직접 관련 없는 경우)
+        - 단순 행사, 세미나, 포럼 개최 알림
+        - 장학금, 인사 발령, 내부 행정 규정(직제 등)
+        - 건설업과 무관한 타 산업(금융 상품 단순 홍보 등) 규제
+"""
+ANALYSIS_SCHEMA = """{"results": [
+            {
+                "idx": (문서 번호),
+                "is_important": true/false,
+                "score": (1~10),
+                "summary": "1. (첫 번째 핵심 내용)\\n2. (두 번째 핵심 내용)\\n3. (세 번째 핵심 내용)",
+                "category": "건설안전/환경규제/공급망/기타"
+            }, ...
+        ]}"""
+# 모든 판정 요청이 공유하는 고정 시스템 프롬프트 (문서 1건도 results 배열 1개로 응답)
+ANALYSIS_SYSTEM_PROMPT = f"""
+        당신은 건설업 ESG 및 산업 안전, 환경 규제 전문가입니다.
+        주어진 문서 각각이 **건설사 및 협력사**의 ESG 경영, 환경 규제 준수, 산업 안전(중대재해), 혹은 컴플라이언스에 영향을 미치는 **중요한** 내용인지 판단해주세요.
+        {ANALYSIS_CRITERIA}
+        결과를 문서 순서대로 다음 JSON 객체로만 출력 (results 길이는 문서 수, idx는 문서 번호):
+        {ANALYSIS_SCHEMA}
+        * 주의: 'summary' 필드는 반드시 한국어로 작성하고, 1, 2, 3 번호를 매겨서 3줄로 작성해주세요.
+        """
+ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessage(content=ANALYSIS_SYSTEM_PROMPT),
+    ("user", "{documents}\n\n문서 수: {count}"),
+])
+# 한 번의 LLM 호출로 판정할 최대 문서 수 (많을수록 판정 품질이 떨어짐)
+ANALYSIS_BATCH_SIZE = 5
+# 문서 1건당 출력 토큰 상한 / 동시에 보낼 LLM 요청 수 (OpenAI RPM 보호)
+ANALYSIS_MAX_TOKENS = 256
+# LLM에 보내는 미리보기 길이 상한 (한국어는 문자 수 대비 토큰이 많아 토큰 단위로 자름)
+PREVIEW_MAX_TOKENS = 700
+SUMMARY_PREVIEW_MAX_TOKENS = 1500
+LLM_CONCURRENCY = 8
+# 리포트 생성 시 자동 요약을 동시에 요청할 최대 문서 수
+SUMMARY_CONCURRENCY = 5
+# 미리보기 본문이 이보다 짧으면(스캔 PDF 등) 요약을 요청하지 않고 표시 문구를 이력에 저장
+SUMMARY_MIN_PREVIEW_CHARS = 200
+SUMMARY_SKIPPED = "(본문 추출 실패 — 요약 생략)"
+# PDF 추출 방식 기준 페이지 수: 10쪽 이하는 한 번에, 200쪽 이상만 멀티프로세스 (작은 파일은 프로세스 기동 비용이 더 큼)
+PDF_BATCH_MAX_PAGES = 10
+PARALLEL_PDF_MIN_PAGES = 200
+PDF_MAX_WORKERS = 8
+# 프로세스 작업 1개가 맡는 페이지 수 (워커 수로 균등 분할하되 이 범위로 제한)
+PDF_MIN_PAGES_PER_TASK = 16
+PDF_MAX_PAGES_PER_TASK = 500
+# 판정용 미리보기는 합자/공백 보존 처리를 생략한 가장 가벼운 추출 (DB 저장용 본문은 기본값 유지)
+PREVIEW_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP
+# 크롤링 1회 동안 모은 청크를 이 크기로 나눠 벡터DB에 한 번에 추가
+CHUNK_FLUSH_BATCH = 200
+# 다운로드 완료 확인 주기(초) / Chrome 임시 파일 확장자
+DOWNLOAD_POLL_INTERVAL = 0.2
+PARTIAL_DOWNLOAD_SUFFIXES = (".crdownload", ".tmp", ".part")
+# 리포트 생성 시 파일 존재 확인에 쓰는 다운로드 폴더 목록 캐시 유효 시간(초)
+DOWNLOAD_LISTING_TTL = 60
+# 리포트 생성 시 먼저 골라 보는 최신 이력 수 (최대 표시 10건 + 파일 소실 등으로 건너뛸 여유분)
+HISTORY_SCAN_WINDOW = 20
+# 백그라운드 스케줄러(start_scheduler)의 크롤링 주기 (초)
+CRAWL_INTERVAL = 3600
+# 초기 대량 적재 시에만 켜는 SQLite 설정 (fsync 생략 - 적재 중 장애 시 DB 손상 위험을 감수)
+BULK_INGEST = os.getenv("BULK_INGEST") == "1"
+BULK_INGEST_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF", "temp_store": "MEMORY"}
+# HNSW 인덱스 갱신 주기: 청크를 brute-force 버퍼에 batch_size개 모았다가 한 번에 인덱스에 반영,
+# sync_threshold개마다 디스크에 저장 (기본값 100/1000은 크롤링 1회 적재량에 비해 너무 잦음)
+HNSW_COLLECTION_METADATA = {"hnsw:batch_size": 1000, "hnsw:sync_threshold": 4000}
+
 # [변경] 신뢰할 수 있는 뉴스 소스 도메인 목록
 TRUSTED_NEWS_DOMAINS = [
     "yna.co.kr",       # 연합뉴스
@@ -88,6 +396,40 @@ TRUSTED_NEWS_DOMAINS = [
     "fsc.go.kr"        # 금융위원회
 ]
 
+def _parse_timestamp(value: Optional[str]) -> float:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _is_finished_download(name: str, before_files: set) -> bool:
+    return name not in before_files and not name.endswith(PARTIAL_DOWNLOAD_SUFFIXES)
+
+
+class _DownloadHandler(FileSystemEventHandler):
+    """다운로드 폴더에 완성 파일이 생기거나(.crdownload → 최종 이름 변경 포함) 옮겨지면 done 설정"""
+
+    def __init__(self, before_files: set):
+        super().__init__()
+        self.before_files = before_files
+        self.path: Optional[str] = None
+        self.done = threading.Event()
+
+    def _check(self, path: str):
+        if not self.done.is_set() and _is_finished_download(os.path.basename(path), self.before_files):
+            self.path = path
+            self.done.set()
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._check(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._check(event.dest_path)
+
+
 class RegulationMonitor:
     """
     [규제 모니터링 엔진 - AI Enhanced]
@@ -97,12 +439,17 @@ class RegulationMonitor:
     4. 선별된 중요 문서만 Vector DB에 자동 저장 (RAG 준비)
     """
     _instance = None
+    _instance_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(RegulationMonitor, cls).__new__(cls)
-            cls._instance._initialize()
-            cls._instance.start_scheduler() # Start background scheduler
+            with cls._instance_lock:
+                # 동시에 생성 요청이 들어와도 초기화/스케줄러 시작은 한 번만
+                if cls._instance is None:
+                    instance = super(RegulationMonitor, cls).__new__(cls)
+                    instance._initialize()
+                    instance.start_scheduler() # Start background scheduler
+                    cls._instance = instance
         return cls._instance
 
     def _initialize(self):
@@ -111,19 +458,43 @@ class RegulationMonitor:
         # Embeddings & VectorDB는 필요할 때 로드 (Lazy Loading)
         self.embeddings = None
         self.vector_db = None
+        # 문서마다 add_documents를 호출하지 않고 크롤링이 끝날 때 모아서 저장 (_flush_chunks)
+        self._pending_chunks: List[Tuple[str, Document]] = []  # (결정적 청크 ID, 청크)
+        self._chunk_lock = threading.Lock()
+        # 크롤링 1회 동안 모든 사이트가 공유하는 브라우저 (드라이버 경로는 프로세스당 1회만 조회)
+        self._driver = None
+        self._driver_path: Optional[str] = None
+        self._crawl_lock = threading.Lock()
+        atexit.register(self._quit_driver)
         
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+        # 대기 시간/재시도 상한을 명시 (재시도는 OpenAI 클라이언트의 지수 백오프 사용)
+        # 출력 토큰 상한은 판정 체인(_analysis_chain)에서만 지정 - 요약/뉴스 정리는 잘리지 않도록 제한 없음
+        self.llm = ChatOpenAI(
+            model="gpt-4o-mini",
+            temperature=0,
+            timeout=20,
+            max_retries=3,
+        )
+        self._analysis_chains: Dict[int, object] = {}
         
-        self.tavily = TavilySearchResults(
-            max_results=5,
-            include_domains=TRUSTED_NEWS_DOMAINS
+        # Tavily 검색 등 외부 API 호출용 공유 HTTP 클라이언트 (keep-alive 연결 재사용)
+        self._http = httpx.Client(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=30,
         )
+        atexit.register(self.close)
         
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
         os.makedirs(HISTORY_DIR, exist_ok=True)
         os.makedirs(VECTOR_DB_DIR, exist_ok=True)
         
         self.history = self._load_history()
+        # 처리 이력은 메모리에만 반영하고 크롤링이 끝날 때 한 번 저장 (_flush_history)
+        self._history_dirty = False
+        # 다운로드 폴더 파일 목록 캐시 (만료 시각, 경로 집합)
+        self._download_listing: Tuple[float, set] = (0.0, set())
+        # 스케줄러 대기(Event.wait)를 깨우는 종료 신호
+        self._stop = threading.Event()
 
     def _ensure_vector_db(self):
         """Vector DB 및 Embeddings 지연 초기화"""
@@ -131,15 +502,27 @@ class RegulationMonitor:
             return
 
         print("🔌 [System] Embeddings 모델 및 Vector DB 초기화 중... (다소 시간이 소요될 수 있습니다)")
+        model_kwargs = {'device': 'cpu'}
+        batch_size = 64
+        try:
+            import torch
+            if torch.cuda.is_available():
+                # GPU가 있으면 FP16 가중치로 로드하고 배치를 키움 (없으면 CPU FP32 유지)
+                model_kwargs = {'device': 'cuda', 'model_kwargs': {'torch_dtype': torch.float16}}
+                batch_size = 128
+        except ImportError:  # pragma: no cover - optional dependency
+            pass
+
         try:
             self.embeddings = HuggingFaceEmbeddings(
                 model_name="BAAI/bge-m3",
-                model_kwargs={'device': 'cpu'},
-                encode_kwargs={'normalize_embeddings': True}
+                model_kwargs=model_kwargs,
+                encode_kwargs={'normalize_embeddings': True, 'batch_size': batch_size}
             )
             self.vector_db = Chroma(
                 collection_name="esg_regulations",
                 embedding_function=self.embeddings,
+                collection_metadata=HNSW_COLLECTION_METADATA,
                 persist_directory=VECTOR_DB_DIR
             )
             print("✅ [System] Vector DB 초기화 완료")
@@ -151,146 +534,305 @@ class RegulationMonitor:
     def _load_history(self) -> Dict:
         if os.path.exists(HISTORY_FILE):
             try:
-                with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                if orjson is not None:
+                    with open(HISTORY_FILE, 'rb') as f:
+                        history = orjson.loads(f.read())
+                else:
+                    with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+                        history = json.load(f)
             except Exception:
                 return {}
+            # processed_at(ISO 문자열)은 로드할 때 한 번만 파싱해 '_ts'(타임스탬프)로 보관
+            for info in history.values():
+                info['_ts'] = _parse_timestamp(info.get('processed_at'))
+            return history
         return {}
 
     def _save_history(self):
+        """임시 파일에 쓴 뒤 os.replace로 교체 (저장 도중 중단돼도 기존 파일이 깨지지 않음)"""
+        tmp_path = None
         try:
-            with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, ensure_ascii=False, indent=2)
+            # '_'로 시작하는 키는 메모리 전용 파생 값이므로 저장하지 않음
+            serializable = {
+                url: {k: v for k, v in info.items() if not k.startswith('_')}
+                for url, info in self.history.items()
+            }
+            history_dir = os.path.dirname(HISTORY_FILE) or "."
+            with tempfile.NamedTemporaryFile('wb', dir=history_dir, suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                if orjson is not None:
+                    f.write(orjson.dumps(serializable, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(serializable, ensure_ascii=False, indent=2).encode('utf-8'))
+            os.replace(tmp_path, HISTORY_FILE)
+            tmp_path = None
+            self._history_dirty = False
         except Exception as e:
             print(f"⚠️ 히스토리 저장 실패: {e}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _flush_history(self):
+        """변경된 이력이 있을 때만 저장 (다른 프로세스가 그 사이 기록한 항목은 유지)"""
+        if not self._history_dirty:
+            return
+        self.history = {**self._load_history(), **self.history}
+        self._save_history()
 
     def _is_processed(self, url: str) -> bool:
         return url in self.history
 
     def _mark_as_processed(self, url: str, title: str, files: List[str], summary: str = None, origin_url: str = None):
+        now = datetime.now()
         self.history[url] = {
             "title": title,
-            "processed_at": datetime.now().isoformat(),
+            "processed_at": now.isoformat(),
             "files": files,
             "summary": summary,
-            "origin_url": origin_url
+            "origin_url": origin_url,
+            "_ts": now.timestamp()
         }
-        self._save_history()
+        self._history_dirty = True
+        self._download_listing = (0.0, set())  # 새로 받은 파일이 리포트에 바로 보이도록 목록 캐시 무효화
 
     def _extract_text_preview(self, file_path: str, max_pages: int = 3) -> str:
         """파일 내용 프리뷰 추출 (PDF 및 TXT 지원)"""
         text_preview = ""
         try:
-            if file_path.lower().endswith('.pdf'):
-                doc = fitz.open(file_path)
-                for i, page in enumerate(doc):
-                    if i >= max_pages: break
-                    text_preview += page.get_text()
-                doc.close()
-            elif file_path.lower().endswith('.txt'):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    text_preview = f.read(3000) # 앞부분 3000자
-            else:
-                text_preview = "(지원되지 않는 파일 형식입니다)"
+            text_preview = _extract_preview_cached(file_path, os.stat(file_path).st_mtime_ns, max_pages)
         except Exception as e:
             print(f"⚠️ 파일 읽기 실패 ({os.path.basename(file_path)}): {e}")
         return text_preview
 
-    def _analyze_and_store(self, file_path: str, title: str, source: str) -> tuple[bool, Optional[str]]:
-        self._ensure_vector_db()
-        if not self.vector_db:
-            return False, None
+    @staticmethod
+    def _analysis_input(documents: List[Tuple[str, str, str]]) -> Dict:
+        """documents: (출처, 제목, 미리보기) → ANALYSIS_PROMPT 입력"""
+        blocks = "\n\n".join(
+            f"[문서 {i}]\n출처: '{source}'\n문서 제목: '{title}'\n내용 미리보기:\n{_truncate_tokens(preview, PREVIEW_MAX_TOKENS)}"
+            for i, (source, title, preview) in enumerate(documents, start=1)
+        )
+        return {"documents": blocks, "count": len(documents)}
+
+    def _analysis_chain(self, size: int):
+        """문서 size건 판정용 체인 (JSON 모드, 출력 토큰 상한은 문서 수에 비례). 크기별로 한 번만 구성"""
+        chain = self._analysis_chains.get(size)
+        if chain is None:
+            llm = self.llm.bind(response_format={"type": "json_object"}, max_tokens=ANALYSIS_MAX_TOKENS * size)
+            chain = self._analysis_chains[size] = ANALYSIS_PROMPT | llm | JsonOutputParser()
+        return chain
 
+    def _store_analysis(self, file_path: str, title: str, source: str, analysis: Dict) -> tuple[bool, Optional[str]]:
+        """LLM 판정 결과에 따라 중요 문서만 벡터DB에 저장"""
         filename = os.path.basename(file_path)
-        print(f"   🧠 [AI 분석] '{filename}' 중요도 평가 중...")
+        is_important = analysis.get("is_important", False)
+        score = analysis.get("score", 0)
 
-        content_preview = self._extract_text_preview(file_path)
-        if not content_preview:
+        print(f"      👉 [{filename}] 결과: 중요도 {score}점")
+
+        if not (is_important and score >= 6):
+            print(f"      🗑️ [Discard] 중요도가 낮아 DB에 저장하지 않습니다.")
             return False, None
 
-        prompt = f"""
-        당신은 건설업 ESG 및 산업 안전, 환경 규제 전문가입니다. 
-        출처: '{source}'
-        문서 제목: '{title}'
-        내용 미리보기:
-        {content_preview[:2000]}
+        print(f"      💾 [Vector DB] 중요 문서로 식별되어 DB에 저장합니다.")
 
-        이 문서가 **건설사 및 협력사**의 ESG 경영, 환경 규제 준수, 산업 안전(중대재해), 혹은 컴플라이언스에 영향을 미치는 **중요한** 내용인지 판단해주세요.
-        
-        [판단 기준 - 중요 (High Score 7~10)]
-        - 건설 현장 안전, 중대재해처벌법 관련 사항
-        - 폐기물 관리, 탄소 배출, 대기/수질 오염 등 건설 환경 규제
-        - 하도급 공정거래, 협력사 지원 등 공급망 ESG
-        - 법률/시행령 개정안, 입법예고, 처벌 기준 강화
-        
-        [판단 기준 - 제외/낮음 (Score 1~3)]
-        - **야생생물/동물 보호** (건설 현장 환경영향평가와 직접 관련 없는 경우)
-        - 단순 행사, 세미나, 포럼 개최 알림
-        - 장학금, 인사 발령, 내부 행정 규정(직제 등)
-        - 건설업과 무관한 타 산업(금융 상품 단순 홍보 등) 규제
+        # Use 'summary' from analysis, fallback to 'reason' if old format (though prompt changed)
+        summary_text = analysis.get("summary", analysis.get("reason", "요약 없음"))
 
-        결과를 JSON 형식으로 출력:
-        {{
-            "is_important": true/false,
-            "score": (1~10),
-            "summary": "1. (첫 번째 핵심 내용)\\n2. (두 번째 핵심 내용)\\n3. (세 번째 핵심 내용)",
-            "category": "건설안전/환경규제/공급망/기타"
-        }}
-        * 주의: 'summary' 필드는 반드시 한국어로 작성하고, 1, 2, 3 번호를 매겨서 3줄로 작성해주세요.
-        """
-        
+        # PDF는 전체 본문을 한 문자열로 만들지 않고 페이지(구간)별로 바로 분할
+        if file_path.lower().endswith('.pdf'):
+            texts = _iter_pdf_text(file_path)
+        # TXT 처리 (law.go.kr 등)
+        elif file_path.lower().endswith('.txt'):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                texts = [f.read()]
+        else:
+            texts = []
+
+        metadata = {
+            "source": source,
+            "title": title,
+            "filename": filename,
+            "category": analysis.get("category", "Uncategorized"),
+            "crawled_at": datetime.now().isoformat()
+        }
+        text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+        chunks = []
+        for text in texts:
+            if text.strip():
+                chunks.extend(text_splitter.create_documents([text], metadatas=[metadata]))
+
+        if chunks:
+            # 같은 파일을 다시 처리해도 같은 ID가 나오도록 (파일명, 순번, 본문 앞부분)으로 ID 생성
+            ids = [
+                hashlib.sha1(f"{filename}:{i}:{c.page_content[:64]}".encode("utf-8")).hexdigest()
+                for i, c in enumerate(chunks)
+            ]
+            with self._chunk_lock:
+                self._pending_chunks.extend(zip(ids, chunks))
+            print(f"      ✅ DB 저장 대기열에 추가 ({len(chunks)} chunks)")
+        return True, summary_text
+
+    def _flush_chunks(self, batch: int = CHUNK_FLUSH_BATCH) -> int:
+        """대기 중인 청크를 batch개씩 벡터DB에 추가하고 저장한 청크 수를 반환"""
+        with self._chunk_lock:
+            pending, self._pending_chunks = self._pending_chunks, []
+        if not pending or not self.vector_db:
+            return 0
+
+        collection = self.vector_db._collection
+        # 대기열 안의 중복 ID와 이미 DB에 있는 청크는 임베딩/저장 생략 (재크롤링 시 인덱스 중복 방지)
+        pending = list(dict(pending).items())
         try:
-            response = self.llm.invoke(prompt)
-            response_text = response.content.replace("```json", "").replace("```", "").strip()
-            analysis = json.loads(response_text)
-            
-            is_important = analysis.get("is_important", False)
-            score = analysis.get("score", 0)
-            
-            print(f"      👉 결과: 중요도 {score}점")
+            existing = set(collection.get(ids=[chunk_id for chunk_id, _ in pending], include=[])["ids"])
+        except Exception as e:
+            print(f"⚠️ [Vector DB] 기존 청크 조회 실패, 전체 upsert로 진행: {e}")
+            existing = set()
+        if existing:
+            print(f"   ⏭️ [Vector DB] 이미 저장된 청크 {len(existing)}개 생략")
+            pending = [(chunk_id, c) for chunk_id, c in pending if chunk_id not in existing]
+            if not pending:
+                return 0
 
-            if is_important and score >= 6:
-                print(f"      💾 [Vector DB] 중요 문서로 식별되어 DB에 저장합니다.")
-                
-                # Use 'summary' from analysis, fallback to 'reason' if old format (though prompt changed)
-                summary_text = analysis.get("summary", analysis.get("reason", "요약 없음"))
-                
-                full_text = ""
-                # PDF 처리
-                if file_path.lower().endswith('.pdf'):
-                    full_doc = fitz.open(file_path)
-                    for page in full_doc:
-                        full_text += page.get_text()
-                    full_doc.close()
-                # TXT 처리 (law.go.kr 등)
-                elif file_path.lower().endswith('.txt'):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        full_text = f.read()
-                
-                if full_text:
-                    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-                    chunks = text_splitter.create_documents(
-                        [full_text], 
-                        metadatas=[{
-                            "source": source,
-                            "title": title,
-                            "filename": filename,
-                            "category": analysis.get("category", "Uncategorized"),
-                            "crawled_at": datetime.now().isoformat()
-                        }]
+        print(f"💾 [Vector DB] 청크 {len(pending)}개 임베딩 및 일괄 저장 중...")
+        try:
+            # 청크별/파일별로 나눠 호출하지 않고 전체를 한 번에 임베딩 (모델 내부에서 batch_size 단위로 처리)
+            vectors = self.embeddings.embed_documents([c.page_content for _, c in pending])
+        except Exception as e:
+            print(f"⚠️ [Vector DB] 임베딩 실패: {e}")
+            with self._chunk_lock:
+                self._pending_chunks[:0] = pending
+            return 0
+
+        with self._bulk_ingest_pragmas():
+            for start in range(0, len(pending), batch):
+                part = pending[start:start + batch]
+                try:
+                    collection.upsert(
+                        ids=[chunk_id for chunk_id, _ in part],
+                        documents=[c.page_content for _, c in part],
+                        metadatas=[c.metadata for _, c in part],
+                        embeddings=vectors[start:start + batch],
                     )
-                    self.vector_db.add_documents(chunks)
-                    print(f"      ✅ DB 저장 완료 ({len(chunks)} chunks)")
-                return True, summary_text
-            else:
-                print(f"      🗑️ [Discard] 중요도가 낮아 DB에 저장하지 않습니다.")
-                return False, None
+                except Exception as e:
+                    # 실패한 구간부터는 다음 flush 때 다시 시도
+                    print(f"⚠️ [Vector DB] 일괄 저장 실패: {e}")
+                    with self._chunk_lock:
+                        self._pending_chunks[:0] = pending[start:]
+                    return start
+        print(f"   ✅ DB 저장 완료 ({len(pending)} chunks)")
+        return len(pending)
+
+    @contextmanager
+    def _bulk_ingest_pragmas(self):
+        """BULK_INGEST=1이면 적재 동안 Chroma 내부 SQLite 연결의 저널/동기화를 끄고 끝나면 원복.
+
+        Chroma 내부 구조(버전별로 다름)에 의존하므로 연결을 얻지 못하면 아무것도 하지 않음.
+        같은 스레드의 연결에만 적용되므로 반드시 실제 add를 수행하는 스레드에서 사용.
+        """
+        conn, previous = None, {}
+        if BULK_INGEST:
+            try:
+                conn = self.vector_db._client._server._sysdb._conn_pool.connect()
+                for name, value in BULK_INGEST_PRAGMAS.items():
+                    previous[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+                    conn.execute(f"PRAGMA {name} = {value}")
+                print("   ⚡ [Vector DB] 대량 적재 모드 (SQLite journal/synchronous OFF)")
+            except Exception as e:
+                print(f"   ⚠️ [Vector DB] 대량 적재 설정 적용 실패, 기본 설정으로 진행: {e}")
+                conn = None
+        try:
+            yield
+        finally:
+            if conn is not None:
+                for name, value in previous.items():
+                    try:
+                        conn.execute(f"PRAGMA {name} = {value}")
+                    except Exception as e:
+                        print(f"   ⚠️ [Vector DB] SQLite 설정 원복 실패 ({name}): {e}")
+
+    def _analyze_and_store(self, file_path: str, title: str, source: str) -> tuple[bool, Optional[str]]:
+        return self._analyze_batch([(file_path, title, source)])[0]
 
+    def _judge_group(self, group: List[Tuple[str, str, str, str]]) -> List[Optional[Dict]]:
+        """group: (file_path, title, source, preview) 목록 → 문서별 판정 dict (실패 시 None)"""
+        inputs = self._analysis_input([(source, title, preview) for _, title, source, preview in group])
+        try:
+            verdicts = self._analysis_chain(len(group)).invoke(inputs).get("results")
+            if not isinstance(verdicts, list) or len(verdicts) != len(group):
+                raise ValueError(f"판정 개수 불일치 ({len(verdicts) if isinstance(verdicts, list) else 'N/A'}/{len(group)})")
+            by_position = {int(v.get("idx", pos)): v for pos, v in enumerate(verdicts, start=1)}
+            return [by_position.get(pos, verdicts[pos - 1]) for pos in range(1, len(group) + 1)]
         except Exception as e:
-            print(f"      ❌ AI 분석 중 오류: {e}")
-            return False, None
+            if len(group) == 1:
+                print(f"      ❌ AI 분석 중 오류 ({os.path.basename(group[0][0])}): {e}")
+                return [None]
+            print(f"      ⚠️ 일괄 분석 실패, 문서별로 재시도합니다: {e}")
+            return [self._judge_group([item])[0] for item in group]
+
+    def _analyze_batch(self, items: List[Tuple[str, str, str]]) -> List[tuple[bool, Optional[str]]]:
+        """여러 문서 (file_path, title, source)를 최대 ANALYSIS_BATCH_SIZE개씩 묶어 판정.
+
+        묶음별 LLM 호출은 최대 LLM_CONCURRENCY개까지 동시에 보내고, 응답 파싱에 실패한
+        묶음은 문서별로 재시도한다. 벡터DB 저장은 판정이 모두 끝난 뒤 순차로 수행.
+        """
+        if not items:
+            return []
+        self._ensure_vector_db()
+        if not self.vector_db:
+            return [(False, None)] * len(items)
+
+        indexed = []
+        for idx, (file_path, title, source) in enumerate(items):
+            print(f"   🧠 [AI 분석] '{os.path.basename(file_path)}' 중요도 평가 중...")
+            preview = self._extract_text_preview(file_path)
+            if preview:
+                indexed.append((idx, (file_path, title, source, preview)))
+        groups = [indexed[i:i + ANALYSIS_BATCH_SIZE] for i in range(0, len(indexed), ANALYSIS_BATCH_SIZE)]
+
+        # OpenAI 호출은 I/O 대기이므로 스레드로 겹쳐 실행 (동시 요청 수로 RPM 한도 보호)
+        with ThreadPoolExecutor(max_workers=LLM_CONCURRENCY) as pool:
+            judged = list(pool.map(lambda g: self._judge_group([item for _, item in g]), groups))
+
+        outcomes: List[tuple[bool, Optional[str]]] = [(False, None)] * len(items)
+        for group, verdicts in zip(groups, judged):
+            for (idx, (file_path, title, source, _)), analysis in zip(group, verdicts):
+                if analysis is not None:
+                    outcomes[idx] = self._store_analysis(file_path, title, source, analysis)
+        return outcomes
+
+    def _finalize_posts(self, pending: List[Dict]) -> List[Dict]:
+        """수집한 게시글의 첨부를 일괄 분석한 뒤 처리 이력에 기록하고 결과 목록을 반환.
+
+        pending 항목: key, source, title, files, origin_url, analyze(분석할 파일 경로 목록)
+        """
+        jobs = [(path, p["title"], p["source"]) for p in pending for path in p["analyze"]]
+        outcomes = iter(self._analyze_batch(jobs))
+
+        results = []
+        for p in pending:
+            summary = None
+            for _ in p["analyze"]:
+                summary = next(outcomes)[1] or summary
+            self._mark_as_processed(p["key"], p["title"], p["files"], summary, origin_url=p["origin_url"])
+            results.append({"source": p["source"], "title": p["title"], "files": p["files"], "origin_url": p["origin_url"]})
+        return results
 
     def _get_chrome_driver(self):
+        """공유 Chrome 드라이버 (없으면 생성). 종료는 _quit_driver에서 일괄 처리"""
+        if self._driver is None:
+            self._driver = self._create_chrome_driver()
+        return self._driver
+
+    def _quit_driver(self):
+        driver, self._driver = self._driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"⚠️ 브라우저 종료 실패: {e}")
+
+    def _create_chrome_driver(self):
         chrome_options = Options()
         chrome_options.add_argument("--headless=new") 
         chrome_options.add_argument("--no-sandbox")
@@ -316,9 +858,84 @@ class RegulationMonitor:
         binary_path = os.getenv("CHROME_BINARY")
         if binary_path and "chromium" in binary_path:
             chrome_type = ChromeType.CHROMIUM
-        service = ChromeService(ChromeDriverManager(chrome_type=chrome_type).install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        return driver
+        if self._driver_path is None:
+            self._driver_path = self._resolve_driver_path(chrome_type)
+        service = ChromeService(self._driver_path)
+        return webdriver.Chrome(service=service, options=chrome_options)
+
+    @staticmethod
+    def _resolve_driver_path(chrome_type) -> str:
+        """ChromeDriverManager.install()은 네트워크로 버전을 확인하므로 결과를 디스크에 1주일간 캐시"""
+        try:
+            if time.time() - os.path.getmtime(DRIVER_PATH_CACHE) < DRIVER_PATH_MAX_AGE:
+                with open(DRIVER_PATH_CACHE, encoding="utf-8") as f:
+                    cached = f.read().strip()
+                if cached and os.path.exists(cached):
+                    return cached
+        except OSError:
+            pass
+
+        driver_path = ChromeDriverManager(chrome_type=chrome_type).install()
+        try:
+            os.makedirs(os.path.dirname(DRIVER_PATH_CACHE), exist_ok=True)
+            with open(DRIVER_PATH_CACHE, "w", encoding="utf-8") as f:
+                f.write(driver_path)
+        except OSError as e:
+            print(f"⚠️ 드라이버 경로 캐시 저장 실패: {e}")
+        return driver_path
+
+    @staticmethod
+    def _click_and_wait(driver, element, timeout: int = 10):
+        """링크를 클릭하고 현재 페이지가 교체될 때(클릭한 요소가 stale)까지만 대기"""
+        driver.execute_script("arguments[0].click();", element)
+        try:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(element))
+        except TimeoutException:
+            pass  # 같은 페이지 안에서 AJAX로 갱신되는 경우
+
+    @staticmethod
+    def _wait_for_element(driver, selector: str, timeout: int = 10) -> bool:
+        try:
+            WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+            return True
+        except TimeoutException:
+            return False
+
+    @staticmethod
+    def _find_new_download(before_files: set) -> Optional[str]:
+        with os.scandir(DOWNLOAD_DIR) as entries:
+            for entry in entries:
+                if _is_finished_download(entry.name, before_files):
+                    return entry.path
+        return None
+
+    @classmethod
+    def _wait_for_download(cls, before_files: set, timeout: float = 15) -> Optional[str]:
+        """before_files 이후 새로 생긴 완성 파일(임시 확장자 제외)의 경로, 시간 초과 시 None"""
+        if Observer is None:
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                found = cls._find_new_download(before_files)
+                if found:
+                    return found
+                time.sleep(DOWNLOAD_POLL_INTERVAL)
+            return None
+
+        # watchdog(inotify 등) 이벤트로 완성 파일이 생기는 즉시 깨어남
+        handler = _DownloadHandler(before_files)
+        observer = Observer()
+        observer.schedule(handler, DOWNLOAD_DIR, recursive=False)
+        observer.start()
+        try:
+            # 감시 시작 전에 이미 끝난 다운로드는 이벤트가 없으므로 한 번 확인
+            found = cls._find_new_download(before_files)
+            if found:
+                return found
+            handler.done.wait(timeout)
+            return handler.path
+        finally:
+            observer.stop()
+            observer.join()
 
     def _fetch_law_go_kr(self, driver, target_info: Dict) -> List[Dict]:
         """
@@ -328,7 +945,7 @@ class RegulationMonitor:
         """
         url = target_info["url"]
         source_name = target_info["name"]
-        results = []
+        pending = []
 
         print(f"📡 [{source_name}] 접속 중... ({url})")
         try:
@@ -360,15 +977,15 @@ class RegulationMonitor:
                     if not target_link: continue
 
                     unique_key = f"{source_name}_{title}"
-                    if self._is_processed(unique_key):
+                    if self._is_processed(unique_key) or any(p["key"] == unique_key for p in pending):
                         print(f"   ⏭️ [Skip] {source_name}: {title}")
                         continue
 
                     print(f"   🔎 [New] {source_name} 분석: {title}")
                     
                     # 상세 페이지 진입 (law.go.kr은 클릭 시 페이지 이동/AJAX 로딩)
-                    driver.execute_script("arguments[0].click();", target_link)
-                    time.sleep(3) # 로딩 대기
+                    self._click_and_wait(driver, target_link)
+                    self._wait_for_element(driver, "#contentBody, .lawCon, #conScroll")
                     
                     # 본문 텍스트 추출 시도 (법령 본문 영역)
                     # law.go.kr 본문 ID 후보: contentBody, conScroll, viewArea 등
@@ -400,12 +1017,10 @@ class RegulationMonitor:
                         
                         print(f"      ✅ 본문 텍스트 저장 완료: {file_name}")
                         downloaded_files.append(file_path)
-                        
-                        # AI 분석 및 저장
-                        _, summary = self._analyze_and_store(file_path, title, source_name)
-                        
-                    self._mark_as_processed(unique_key, title, downloaded_files, summary, origin_url=url)
-                    results.append({"source": source_name, "title": title, "files": downloaded_files, "origin_url": url})
+
+                    # AI 분석은 목록 순회가 끝난 뒤 일괄 수행
+                    pending.append({"key": unique_key, "source": source_name, "title": title,
+                                    "files": downloaded_files, "origin_url": url, "analyze": list(downloaded_files)})
                     
                     # 목록으로 돌아가기 (뒤로가기 혹은 URL 재접속)
                     driver.get(url)
@@ -414,19 +1029,19 @@ class RegulationMonitor:
                 except Exception as e:
                     print(f"      ⚠️ 게시글 처리 중 오류: {e}")
                     driver.get(url)
-                    time.sleep(2)
+                    self._wait_for_element(driver, "tbody")
 
         except Exception as e:
             print(f"❌ [{source_name}] 크롤링 실패: {e}")
             
-        return results
+        return self._finalize_posts(pending)
 
     def _scrape_generic_board(self, driver, target_info: Dict) -> List[Dict]:
         """[공통] 일반 게시판 크롤링"""
         base_url = target_info["url"]
         source_name = target_info["name"]
         page_param = target_info.get("page_param")
-        results = []
+        pending = []
 
         max_pages = 3 if page_param else 1
         
@@ -466,17 +1081,17 @@ class RegulationMonitor:
                         
                         unique_key = f"{source_name}_{title}"
                         
-                        if self._is_processed(unique_key):
+                        if self._is_processed(unique_key) or any(p["key"] == unique_key for p in pending):
                             print(f"   ⏭️ [Skip] {source_name}: {title}")
                             continue
                             
                         print(f"   🔎 [New] {source_name} 분석: {title}")
                         
-                        driver.execute_script("arguments[0].click();", post_link)
-                        time.sleep(2)
+                        self._click_and_wait(driver, post_link)
+                        # 이전 페이지가 사라진 것만으로는 첨부 링크가 그려졌다는 보장이 없으므로 잠깐 대기
+                        self._wait_for_element(driver, "a[href*='down' i], a[href*='file' i]", timeout=3)
                         
                         downloaded_files = []
-                        summary = None
                         potential_links = driver.find_elements(By.TAG_NAME, "a")
                         file_links = []
                         for link in potential_links:
@@ -490,40 +1105,306 @@ class RegulationMonitor:
                             print(f"      📥 다운로드 시도: {f_name}")
                             before_files = set(os.listdir(DOWNLOAD_DIR))
                             driver.execute_script("arguments[0].click();", link)
-                            
-                            for _ in range(10):
-                                time.sleep(1)
-                                new_files = set(os.listdir(DOWNLOAD_DIR)) - before_files
-                                if new_files:
-                                    new_file = list(new_files)[0]
-                                    if not new_file.endswith('.crdownload'):
-                                        full_path = os.path.join(DOWNLOAD_DIR, new_file)
-                                        downloaded_files.append(full_path)
-                                        print(f"      ✅ 다운로드 완료: {new_file}")
-                                        _, summary = self._analyze_and_store(full_path, title, source_name)
-                                        break
+                            full_path = self._wait_for_download(before_files, timeout=10)
+                            if full_path:
+                                downloaded_files.append(full_path)
+                                print(f"      ✅ 다운로드 완료: {os.path.basename(full_path)}")
                         
-                        self._mark_as_processed(unique_key, title, downloaded_files, summary, origin_url=target_url)
-                        results.append({"source": source_name, "title": title, "files": downloaded_files, "origin_url": target_url})
+                        pending.append({"key": unique_key, "source": source_name, "title": title,
+                                        "files": downloaded_files, "origin_url": target_url, "analyze": list(downloaded_files)})
                         
                         driver.back()
                         wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
-                        time.sleep(1)
                         
                     except Exception as e:
                         print(f"      ⚠️ 게시글 처리 중 스킵: {e}")
                         if target_url not in driver.current_url:
                             driver.back()
-                            time.sleep(1)
+                            self._wait_for_element(driver, "table tbody tr")
 
             except Exception as e:
                 print(f"❌ [{source_name}] Page {page} 크롤링 실패: {e}")
                 
+        return self._finalize_posts(pending)
+
+    async def _scrape_boards_http(self, targets: List[Dict]) -> List[Optional[List[Dict]]]:
+        """여러 게시판의 목록/상세/첨부 요청을 동시에 수행 (대상별 미분석 게시글 목록, 정적 수집 불가 시 None)"""
+        async with httpx.AsyncClient(
+            headers=HTTP_HEADERS, timeout=HTTP_TIMEOUT, follow_redirects=True, verify=False
+        ) as client:
+            results = await asyncio.gather(
+                *(self._scrape_board_http(client, t) for t in targets), return_exceptions=True
+            )
+        # 한 게시판의 예외가 전체 수집을 중단시키지 않도록 해당 게시판만 None(→ 브라우저) 처리
+        return [_none_on_error(result, t["name"]) for t, result in zip(targets, results)]
+
+    async def _scrape_board_http(self, client: httpx.AsyncClient, target_info: Dict) -> Optional[List[Dict]]:
+        """[공통] 일반 게시판 HTTP 크롤링 (_scrape_generic_board와 같은 규칙, 페이지는 동시에 요청)"""
+        base_url = target_info["url"]
+        source_name = target_info["name"]
+        page_param = target_info.get("page_param")
+
+        max_pages = 3 if page_param else 1
+        sep = "&" if "?" in base_url else "?"
+        list_urls = [
+            f"{base_url}{sep}{page_param}={page}" if page_param else base_url
+            for page in range(1, max_pages + 1)
+        ]
+
+        print(f"📡 [{source_name}] 접속 중 (Page 1~{max_pages}, HTTP)...")
+        pages = await asyncio.gather(*(_fetch_html(client, u) for u in list_urls), return_exceptions=True)
+
+        posts: List[Tuple[str, str, str]] = []
+        for page, (list_url, html) in enumerate(zip(list_urls, pages), start=1):
+            if isinstance(html, Exception):
+                print(f"❌ [{source_name}] Page {page} 크롤링 실패: {html}")
+                continue
+            try:
+                rows = _parse_html(html, list_url).xpath("//table//tbody/tr")[:3]
+            except Exception as e:
+                # 빈 응답(ParserError) 등 목록을 해석할 수 없으면 브라우저로 재시도
+                print(f"   ↪️ [{source_name}] HTTP 목록 해석 실패 → 브라우저로 재시도: {e}")
+                return None
+            for row in rows:
+                for link in row.xpath(".//a"):
+                    title = link.text_content().strip()
+                    if len(title) > 5:  # 제목일 가능성
+                        posts.append((title, link.get("href"), list_url))
+                        break
+
+        # 목록을 못 읽었거나 제목 링크가 JS(onclick/javascript:)로 동작하면 브라우저 필요
+        if not posts or not all(_is_http_link(href) for _, href, _ in posts):
+            return None
+
+        new_posts = []
+        seen = set()
+        for title, href, list_url in posts:
+            unique_key = f"{source_name}_{title}"
+            if self._is_processed(unique_key) or unique_key in seen:
+                print(f"   ⏭️ [Skip] {source_name}: {title}")
+                continue
+            seen.add(unique_key)
+            print(f"   🔎 [New] {source_name} 분석: {title}")
+            new_posts.append((unique_key, title, href, list_url))
+
+        downloads = await asyncio.gather(
+            *(self._download_board_attachment(client, href) for _, _, href, _ in new_posts)
+        )
+
+        # AI 분석/벡터DB 저장은 이벤트 루프 밖에서 게시판 전체를 모아 일괄 수행 (_fetch_legal_updates)
+        return [
+            {"key": unique_key, "source": source_name, "title": title,
+             "files": downloaded_files, "origin_url": list_url, "analyze": list(downloaded_files)}
+            for (unique_key, title, _, list_url), downloaded_files in zip(new_posts, downloads)
+        ]
+
+    async def _download_board_attachment(self, client: httpx.AsyncClient, detail_url: str) -> List[str]:
+        """상세 페이지에서 첫 번째 첨부(.pdf/.hwp/.doc)를 찾아 DOWNLOAD_DIR에 저장"""
+        try:
+            tree = _parse_html(await _fetch_html(client, detail_url), detail_url)
+            for link in tree.xpath("//a[@href]"):
+                href = link.get("href")
+                name_match = ATTACHMENT_NAME_RE.search(link.text_content())
+                if not (_is_http_link(href) and name_match and any(k in href.lower() for k in ("down", "file"))):
+                    continue
+                f_name = os.path.basename(name_match.group(0).strip())
+                print(f"      📥 다운로드 시도: {f_name}")
+                full_path = await self._download_file(client, href, f_name)
+                print(f"      ✅ 다운로드 완료: {f_name}")
+                return [full_path]
+        except Exception as e:
+            print(f"      ⚠️ 게시글 처리 중 스킵: {e}")
+        return []
+
+    async def _download_file(self, client: httpx.AsyncClient, url: str, f_name: str) -> str:
+        """첨부를 DOWNLOAD_DIR에 스트리밍 저장 (호스트당 동시 DOWNLOAD_LIMIT_PER_HOST개)
+
+        같은 이름의 파일이 이미 있거나 다른 게시글이 받는 중이면 "이름 (1).ext"로 저장하고 그 경로를 반환
+        """
+        full_path = _claim_download_path(f_name)
+        part_path = None
+        try:
+            async with _host_slot(client, url):
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    with tempfile.NamedTemporaryFile(dir=DOWNLOAD_DIR, suffix=".part", delete=False) as f:
+                        part_path = f.name
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+            # 완성된 파일만 보이도록 다 받은 뒤 이름 변경
+            os.replace(part_path, full_path)
+            part_path = None
+            return full_path
+        finally:
+            if part_path and os.path.exists(part_path):
+                os.remove(part_path)
+            with _claimed_downloads_lock:
+                _claimed_downloads.discard(full_path)
+
+    def _fetch_reports(self, http_pending: Optional[List[Optional[List[Dict]]]] = None) -> List[Dict]:
+        """GMI/FSC 보고서 수집. 정적 HTML로 처리 가능하면 HTTP, 아니면 Selenium으로 수집
+
+        http_pending: _scrape_all_http로 미리 받아 둔 (GMI, FSC) HTTP 수집 결과
+        """
+        gmi_pending = fsc_pending = None
+        if http_pending is None and lxml_html:
+            http_pending = asyncio.run(self._scrape_reports_http())
+        if http_pending is not None:
+            gmi_pending, fsc_pending = http_pending
+
+        results = self._finalize_posts((gmi_pending or []) + (fsc_pending or []))
+        if gmi_pending is None:
+            results += self._fetch_gmi_reports_selenium()
+        if fsc_pending is None:
+            results += self._fetch_fsc_reports_selenium()
         return results
 
+    async def _scrape_all_http(self, board_targets: List[Dict]) -> List[List[Optional[List[Dict]]]]:
+        """보고서(GMI/FSC)와 정적 법령 게시판의 HTTP 수집을 한 이벤트 루프에서 동시에 수행"""
+        reports, boards = await asyncio.gather(
+            self._scrape_reports_http(), self._scrape_boards_http(board_targets), return_exceptions=True
+        )
+        # 클라이언트 생성 실패 등으로 한쪽이 통째로 실패하면 해당 사이트 전부 브라우저로 재시도
+        if isinstance(reports, Exception):
+            print(f"   ↪️ [보고서] HTTP 수집 실패 → 브라우저로 재시도: {reports}")
+            reports = [None, None]
+        if isinstance(boards, Exception):
+            print(f"   ↪️ [법령 게시판] HTTP 수집 실패 → 브라우저로 재시도: {boards}")
+            boards = [None] * len(board_targets)
+        return [reports, boards]
+
+    async def _scrape_reports_http(self) -> List[Optional[List[Dict]]]:
+        async with httpx.AsyncClient(
+            headers=HTTP_HEADERS, timeout=HTTP_TIMEOUT, follow_redirects=True, verify=False
+        ) as client:
+            gmi, fsc = await asyncio.gather(
+                self._scrape_gmi_http(client), self._scrape_fsc_http(client), return_exceptions=True
+            )
+        return [_none_on_error(gmi, "GMI"), _none_on_error(fsc, "FSC")]
+
+    async def _scrape_gmi_http(self, client: httpx.AsyncClient) -> Optional[List[Dict]]:
+        """GMI 목록 상위 3건 HTTP 수집 (게시글/첨부 링크가 JS로 동작하면 None → Selenium)"""
+        print(f"📡 [GMI] 접속 및 스캔 시작 ({GMI_LIST_URL}, HTTP)")
+        try:
+            tree = _parse_html(await _fetch_html(client, GMI_LIST_URL), GMI_LIST_URL)
+        except Exception as e:
+            print(f"   ↪️ [GMI] HTTP 목록 조회 실패 → 브라우저로 재시도: {e}")
+            return None
+
+        posts = []
+        for row in tree.xpath("//table//tbody/tr")[:3]:
+            links = row.xpath(".//a")
+            if links:
+                posts.append((links[0].text_content().strip(), links[0].get("href")))
+        if not posts or not all(_is_http_link(href) for _, href in posts):
+            return None
+
+        new_posts = []
+        for title, href in posts:
+            unique_key = f"GMI_{title}"
+            if self._is_processed(unique_key) or any(key == unique_key for key, _, _ in new_posts):
+                print(f"   ⏭️ [Skip] 이미 수집된 보고서: {title}")
+                continue
+            print(f"   🔎 [New] 신규 보고서 분석: {title}")
+            new_posts.append((unique_key, title, href))
+
+        downloads = await asyncio.gather(*(
+            self._download_attachments(
+                client, href, "//a[contains(@href, 'downloadAttach') or contains(@href, 'FileDown')]", ("pdf",)
+            )
+            for _, _, href in new_posts
+        ))
+        if any(files is None for files in downloads):
+            return None
+        return [
+            {"key": unique_key, "source": "GMI", "title": title,
+             "files": files, "origin_url": GMI_LIST_URL, "analyze": list(files)}
+            for (unique_key, title, _), files in zip(new_posts, downloads)
+        ]
+
+    async def _scrape_fsc_http(self, client: httpx.AsyncClient) -> Optional[List[Dict]]:
+        """FSC 1~3페이지 키워드 게시글 HTTP 수집 (링크가 JS로 동작하면 None → Selenium)"""
+        print(f"📡 [FSC] 접속 및 스캔 시작 (1~3 페이지 확인, HTTP)")
+        list_urls = [f"{FSC_BASE_URL}?curPage={page}" for page in range(1, 4)]
+        pages = await asyncio.gather(*(_fetch_html(client, u) for u in list_urls), return_exceptions=True)
+
+        posts = []
+        for page, (list_url, html) in enumerate(zip(list_urls, pages), start=1):
+            if isinstance(html, Exception):
+                print(f"❌ [FSC] Page {page} 크롤링 실패: {html}")
+                continue
+            try:
+                items = _parse_html(html, list_url).xpath(
+                    f"//*[{_has_class('board-list')}]//*[{_has_class('subject')}]//a"
+                )
+            except Exception as e:
+                print(f"   ↪️ [FSC] HTTP 목록 해석 실패 → 브라우저로 재시도: {e}")
+                return None
+            for item in items:
+                title = item.text_content().strip()
+                if any(k in title for k in FSC_KEYWORDS):
+                    posts.append((title, item.get("href")))
+        if not all(_is_http_link(href) for _, href in posts):
+            return None
+        if not posts and all(isinstance(html, Exception) for html in pages):
+            return None
+
+        new_posts = []
+        for title, link in posts:
+            if self._is_processed(link) or any(key == link for key, _ in new_posts):
+                print(f"      ⏭️ [Skip] {title}")
+                continue
+            print(f"      🔎 [New] 분석: {title}")
+            new_posts.append((link, title))
+
+        downloads = await asyncio.gather(*(
+            self._download_attachments(client, link, f"//*[{_has_class('file-list')}]//a", (".pdf", ".hwp"))
+            for link, _ in new_posts
+        ))
+        if any(files is None for files in downloads):
+            return None
+        return [
+            {"key": link, "source": "FSC", "title": title, "files": files, "origin_url": link,
+             "analyze": [f for f in files if f.lower().endswith('.pdf')]}
+            for (link, title), files in zip(new_posts, downloads)
+        ]
+
+    async def _download_attachments(
+        self, client: httpx.AsyncClient, detail_url: str, xpath: str, name_filters: Tuple[str, ...]
+    ) -> Optional[List[str]]:
+        """상세 페이지의 첨부(xpath, 파일명에 name_filters 포함)를 모두 저장. 첨부 링크가 JS면 None"""
+        try:
+            tree = _parse_html(await _fetch_html(client, detail_url), detail_url)
+        except Exception as e:
+            print(f"      ⚠️ 게시글 처리 오류: {e}")
+            return []
+
+        targets = []
+        for link in tree.xpath(xpath):
+            f_name = link.text_content().strip()
+            if any(k in f_name.lower() for k in name_filters):
+                name_match = ATTACHMENT_NAME_RE.search(f_name)
+                targets.append((link.get("href"), os.path.basename((name_match.group(0) if name_match else f_name).strip())))
+        if not all(_is_http_link(href) for href, _ in targets):
+            return None
+
+        for _, f_name in targets:
+            print(f"      📥 다운로드 시도: {f_name}")
+        results = await asyncio.gather(
+            *(self._download_file(client, href, f_name) for href, f_name in targets), return_exceptions=True
+        )
+        files = []
+        for (_, f_name), result in zip(targets, results):
+            if isinstance(result, Exception):
+                print(f"      ⚠️ 다운로드 실패 ({f_name}): {result}")
+            else:
+                files.append(result)
+                print(f"      ✅ 다운로드 완료: {f_name}")
+        return files
+
     def _fetch_gmi_reports_selenium(self) -> List[Dict]:
-        target_url = "https://www.gmi.go.kr/np/boardList.do?menuCd=2090&seCd=2"
-        results = []
+        target_url = GMI_LIST_URL
+        pending = []
         
         print(f"📡 [GMI] 접속 및 스캔 시작 ({target_url})")
         driver = self._get_chrome_driver()
@@ -543,16 +1424,15 @@ class RegulationMonitor:
                     title = post_link.text.strip() or driver.execute_script("return arguments[0].innerText;", post_link).strip()
                     unique_key = f"GMI_{title}"
                     
-                    if self._is_processed(unique_key):
+                    if self._is_processed(unique_key) or any(p["key"] == unique_key for p in pending):
                         print(f"   ⏭️ [Skip] 이미 수집된 보고서: {title}")
                         continue
                         
                     print(f"   🔎 [New] 신규 보고서 분석: {title}")
-                    driver.execute_script("arguments[0].click();", post_link)
-                    time.sleep(2)
+                    self._click_and_wait(driver, post_link)
+                    self._wait_for_element(driver, "a[href*='downloadAttach'], a[href*='FileDown']", timeout=3)
                     
                     downloaded_files = []
-                    summary = None
                     file_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='downloadAttach']")
                     if not file_links:
                         file_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='FileDown']")
@@ -563,37 +1443,27 @@ class RegulationMonitor:
                             print(f"      📥 다운로드 시도: {f_name}")
                             before_files = set(os.listdir(DOWNLOAD_DIR))
                             driver.execute_script("arguments[0].click();", link)
-                            for _ in range(15):
-                                time.sleep(1)
-                                new_files = set(os.listdir(DOWNLOAD_DIR)) - before_files
-                                if new_files:
-                                    downloaded_file = list(new_files)[0]
-                                    if not downloaded_file.endswith('.crdownload'):
-                                        full_path = os.path.join(DOWNLOAD_DIR, downloaded_file)
-                                        downloaded_files.append(full_path)
-                                        print(f"      ✅ 다운로드 완료: {downloaded_file}")
-                                        _, summary = self._analyze_and_store(full_path, title, "GMI")
-                                        break
+                            full_path = self._wait_for_download(before_files)
+                            if full_path:
+                                downloaded_files.append(full_path)
+                                print(f"      ✅ 다운로드 완료: {os.path.basename(full_path)}")
                     
-                    self._mark_as_processed(unique_key, title, downloaded_files, summary, origin_url=target_url)
-                    results.append({"source": "GMI", "title": title, "files": downloaded_files, "origin_url": target_url})
+                    pending.append({"key": unique_key, "source": "GMI", "title": title,
+                                    "files": downloaded_files, "origin_url": target_url, "analyze": list(downloaded_files)})
                     driver.back()
                     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
-                    time.sleep(1)
                 except Exception as e:
                     print(f"      ⚠️ 게시글 처리 오류: {e}")
                     if "boardList.do" not in driver.current_url:
                         driver.back()
-                        time.sleep(2)
+                        self._wait_for_element(driver, "table tbody tr")
         except Exception as e:
             print(f"❌ [GMI] 크롤링 실패: {e}")
-        finally:
-            driver.quit()
-        return results
+        return self._finalize_posts(pending)
 
     def _fetch_fsc_reports_selenium(self) -> List[Dict]:
-        base_url = "https://www.fsc.go.kr/no010101"
-        results = []
+        base_url = FSC_BASE_URL
+        pending = []
         
         print(f"📡 [FSC] 접속 및 스캔 시작 (1~3 페이지 확인)")
         driver = self._get_chrome_driver()
@@ -608,26 +1478,23 @@ class RegulationMonitor:
                 wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".board-list .subject a")))
                 
                 list_items = driver.find_elements(By.CSS_SELECTOR, ".board-list .subject a")
-                keywords = ["ESG", "공시", "지속가능", "녹색", "기후", "택소노미"]
-                
                 target_items = []
                 for item in list_items:
                     text = item.text.strip()
-                    if any(k in text for k in keywords):
+                    if any(k in text for k in FSC_KEYWORDS):
                         href = item.get_attribute("href")
                         target_items.append((text, href))
                 
                 for title, link in target_items:
-                    if self._is_processed(link):
+                    if self._is_processed(link) or any(p["key"] == link for p in pending):
                         print(f"      ⏭️ [Skip] {title}")
                         continue
                     
                     print(f"      🔎 [New] 분석: {title}")
                     driver.get(link)
-                    time.sleep(2)
+                    self._wait_for_element(driver, ".file-list a", timeout=3)
                     
                     downloaded_files = []
-                    summary = None
                     file_links = driver.find_elements(By.CSS_SELECTOR, ".file-list a")
                     
                     for f_link in file_links:
@@ -636,47 +1503,59 @@ class RegulationMonitor:
                             print(f"         📥 다운로드 클릭: {f_name}")
                             before_files = set(os.listdir(DOWNLOAD_DIR))
                             f_link.click()
-                            for _ in range(15):
-                                time.sleep(1)
-                                new_files = set(os.listdir(DOWNLOAD_DIR)) - before_files
-                                if new_files:
-                                    new_file = list(new_files)[0]
-                                    if not new_file.endswith('.crdownload'):
-                                        full_path = os.path.join(DOWNLOAD_DIR, new_file)
-                                        downloaded_files.append(full_path)
-                                        if new_file.lower().endswith('.pdf'):
-                                            _, summary = self._analyze_and_store(full_path, title, "FSC")
-                                        break
+                            full_path = self._wait_for_download(before_files)
+                            if full_path:
+                                downloaded_files.append(full_path)
                     
-                    self._mark_as_processed(link, title, downloaded_files, summary, origin_url=link)
-                    results.append({"source": "FSC", "title": title, "files": downloaded_files, "origin_url": link})
+                    pending.append({"key": link, "source": "FSC", "title": title, "files": downloaded_files, "origin_url": link,
+                                    "analyze": [f for f in downloaded_files if f.lower().endswith('.pdf')]})
                     
                     driver.get(target_url)
                     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".board-list .subject a")))
                     
         except Exception as e:
             print(f"❌ [FSC] 크롤링 실패: {e}")
-        finally:
-            driver.quit()
             
-        return results
+        return self._finalize_posts(pending)
 
-    def _fetch_legal_updates(self) -> List[Dict]:
+    @staticmethod
+    def _http_board_targets() -> List[Dict]:
+        """HTTP로 수집할 정적 게시판 (lxml이 없으면 전부 Selenium)"""
+        return [t for t in MINISTRY_TARGETS if t.get("type") == "GENERIC_BOARD"] if lxml_html else []
+
+    def _fetch_legal_updates(self, http_pending: Optional[List[Optional[List[Dict]]]] = None) -> List[Dict]:
+        """http_pending: _scrape_all_http로 미리 받아 둔 정적 게시판별 HTTP 수집 결과"""
         results = []
+
+        # 1) 정적 게시판은 HTTP로 동시에 수집
+        http_targets = self._http_board_targets()
+        browser_targets = [t for t in MINISTRY_TARGETS if t not in http_targets]
+        if http_targets:
+            if http_pending is None:
+                http_pending = asyncio.run(self._scrape_boards_http(http_targets))
+            pending = []
+            for target, site_pending in zip(http_targets, http_pending):
+                if site_pending is None:
+                    print(f"   ↪️ [{target['name']}] 정적 HTML로 처리 불가 → 브라우저로 재시도")
+                    browser_targets.append(target)
+                else:
+                    pending.extend(site_pending)
+            results.extend(self._finalize_posts(pending))
+
+        # 2) JS 렌더링이 필요한 사이트(law.go.kr 등)만 Selenium 사용
+        if not browser_targets:
+            return results
         driver = self._get_chrome_driver()
-        try:
-            for target in MINISTRY_TARGETS:
-                try:
-                    # [변경] 사이트 타입에 따라 전용 크롤러 사용
-                    if target.get("type") == "LAW_GO_KR":
-                        site_results = self._fetch_law_go_kr(driver, target)
-                    else:
-                        site_results = self._scrape_generic_board(driver, target)
-                    results.extend(site_results)
-                except Exception as e:
-                    print(f"❌ {target['name']} 처리 중 오류: {e}")
-        finally:
-            driver.quit()
+        for target in browser_targets:
+            try:
+                # [변경] 사이트 타입에 따라 전용 크롤러 사용
+                if target.get("type") == "LAW_GO_KR":
+                    site_results = self._fetch_law_go_kr(driver, target)
+                else:
+                    site_results = self._scrape_generic_board(driver, target)
+                results.extend(site_results)
+            except Exception as e:
+                print(f"❌ {target['name']} 처리 중 오류: {e}")
         return results
 
     def _get_last_crawl_time(self) -> float:
@@ -696,6 +1575,32 @@ class RegulationMonitor:
         except Exception as e:
             print(f"⚠️ 마지막 크롤링 시간 저장 실패: {e}")
 
+    def _collect_updates(self) -> List[Dict]:
+        """모든 사이트 크롤링 → 벡터DB 일괄 저장. 브라우저 1개를 공유하므로 동시에 한 번만 실행"""
+        with self._crawl_lock:
+            try:
+                # 0. 브라우저가 필요 없는 HTTP 수집(보고서 + 정적 게시판)은 한꺼번에 동시 수행
+                #    (Selenium 단계는 브라우저 1개와 다운로드 폴더를 공유하므로 순차 유지)
+                reports_http = boards_http = None
+                if lxml_html:
+                    try:
+                        reports_http, boards_http = asyncio.run(self._scrape_all_http(self._http_board_targets()))
+                    except Exception as e:
+                        # HTTP 단계가 실패해도 아래 Selenium 경로로 전부 수집
+                        print(f"⚠️ HTTP 동시 수집 실패 → 브라우저로 재시도: {e}")
+                        reports_http = [None, None]
+                        boards_http = [None] * len(self._http_board_targets())
+                # 1. 보고서 수집
+                reports = self._fetch_reports(reports_http)
+                # 2. 법령 업데이트 수집
+                reports += self._fetch_legal_updates(boards_http)
+            finally:
+                # 다음 크롤링(최소 1시간 뒤)까지 브라우저를 띄워두지 않음
+                self._quit_driver()
+                self._flush_history()
+            self._flush_chunks()
+        return reports
+
     def crawl_updates(self):
         """백그라운드에서 실행되는 크롤링 작업 (10일 주기)"""
         last_crawl = self._get_last_crawl_time()
@@ -707,59 +1612,60 @@ class RegulationMonitor:
 
         print(f"\n🔄 [Scheduler] 정기 크롤링 시작 (10일 주기) - {datetime.now().isoformat()}")
         
-        # 1. 보고서 수집
-        self._fetch_gmi_reports_selenium()
-        self._fetch_fsc_reports_selenium()
-        
-        # 2. 법령 업데이트 수집
-        self._fetch_legal_updates()
+        self._collect_updates()
         
         self._set_last_crawl_time()
         print("✅ [Scheduler] 정기 크롤링 완료")
 
     def generate_report(self, query: str = "ESG 규제 동향") -> str:
         """저장된 데이터를 바탕으로 즉시 리포트 생성 (크롤링 수행 X)"""
+        return "".join(self.iter_report(query))
+
+    def iter_report(self, query: str = "ESG 규제 동향") -> Iterator[str]:
+        """generate_report의 마크다운을 조각 단위로 생성 (스트리밍 응답용)
+
+        머리말은 자동 요약 전에 바로 내보내고, 문서 목록은 요약이 끝난 뒤 문서별로 내보냄
+        """
         print(f"📊 [Report] 최신 데이터 기반 리포트 생성 요청: {query}")
         
-        # 0. 히스토리 최신화 (다른 프로세스에서 업데이트된 내용 반영)
-        self.history = self._load_history()
+        # 0. 히스토리 최신화 (다른 프로세스에서 업데이트된 내용 반영, 아직 저장 전인 항목은 유지)
+        self.history = {**self.history, **self._load_history()}
 
         # 1. 최근 10일 이내 수집된 데이터 필터링
+        existing_files = self._existing_downloads()
         recent_reports = []
         recent_files_count = 0
         cutoff_date = datetime.now().timestamp() - (10 * 24 * 3600)
         
-        sorted_history = sorted(self.history.items(), key=lambda x: x[1]['processed_at'], reverse=True)
-        
-        for url, info in sorted_history:
-            processed_at = datetime.fromisoformat(info['processed_at']).timestamp()
-            if processed_at >= cutoff_date:
-                # 파일이 없으면 결과에서 제외
-                if not info.get('files'):
-                    continue
-                
-                # [Fix] 실제 파일 존재 여부 확인 (사용자가 삭제했을 수도 있음)
-                valid_files = [f for f in info['files'] if os.path.exists(f)]
-                if not valid_files:
-                    print(f"   ⚠️ 파일 소실됨 (Skip): {info['title']}")
-                    continue
-                
-                recent_reports.append({
-                    "source": "History", 
-                    "title": info['title'], 
-                    "files": valid_files,
-                    "summary": info.get('summary'),
-                    "key": url,
-                    "origin_url": info.get('origin_url')
-                })
-                recent_files_count += len(info['files'])
+        for url, info in self._iter_history_newest():
+            if info['_ts'] < cutoff_date:
+                break  # 최신순이므로 이후 항목은 모두 기간 밖
+            # 파일이 없으면 결과에서 제외
+            if not info.get('files'):
+                continue
+            
+            # [Fix] 실제 파일 존재 여부 확인 (사용자가 삭제했을 수도 있음)
+            valid_files = [f for f in info['files'] if self._file_exists(f, existing_files)]
+            if not valid_files:
+                print(f"   ⚠️ 파일 소실됨 (Skip): {info['title']}")
+                continue
+            
+            recent_reports.append({
+                "source": "History", 
+                "title": info['title'], 
+                "files": valid_files,
+                "summary": info.get('summary'),
+                "key": url,
+                "origin_url": info.get('origin_url')
+            })
+            recent_files_count += len(info['files'])
             if len(recent_reports) >= 10: break # 최대 10개만 표시
 
         is_fallback = False
         # [Fallback] 최근 데이터가 없으면 과거 이력에서 최신순으로 가져옴
         if not recent_reports:
             print("   ⚠️ 최근 데이터 없음. 이력에서 최신 데이터 검색 중...")
-            for url, info in sorted_history:
+            for url, info in self._iter_history_newest():
                 if not info.get('files'): continue
                 
                 recent_reports.append({
@@ -775,113 +1681,155 @@ class RegulationMonitor:
             
             if recent_reports:
                 is_fallback = True
-                result_str = f"## 🌍 ESG 규제 & 법령 모니터링 리포트 (Archive Data)\n"
-                result_str += f"> ⚠️ 최근 10일 내 신규 문서는 없지만, 가장 최근에 수집된 중요 문서를 표시합니다.\n\n"
+                yield f"## 🌍 ESG 규제 & 법령 모니터링 리포트 (Archive Data)\n"
+                yield f"> ⚠️ 최근 10일 내 신규 문서는 없지만, 가장 최근에 수집된 중요 문서를 표시합니다.\n\n"
             else:
-                result_str = f"## 🌍 ESG 규제 & 법령 모니터링 리포트\n"
+                yield f"## 🌍 ESG 규제 & 법령 모니터링 리포트\n"
         else:
-            result_str = f"## 🌍 ESG 규제 & 법령 모니터링 리포트 (Latest Data)\n"
-            result_str += f"📅 판단 기준: 최근 10일 이내 수집된 데이터\n\n"
+            yield f"## 🌍 ESG 규제 & 법령 모니터링 리포트 (Latest Data)\n"
+            yield f"📅 판단 기준: 최근 10일 이내 수집된 데이터\n\n"
 
         # 2. 요약 없는 문서 자동 요약 (사용자 요청 대응)
+        # PDF 추출은 순차로(PyMuPDF는 스레드 안전하지 않음), LLM 호출만 동시에 수행
+        todo = []
         for r in recent_reports:
             if not r.get('summary') and r['files']:
-                target_file = r['files'][0]
                 print(f"   🤖 [Auto-Sum] '{r['title']}' 요약 생성 시도...")
-                try:
-                    # _analyze_and_store 로직을 일부 재사용하여 요약만 생성
-                    preview = self._extract_text_preview(target_file, max_pages=5)
-                    if preview:
-                        prompt = f"""
-                        다음 문서의 내용을 한국어로 3줄 요약해주세요.
-                        문서 제목: {r['title']}
-                        내용 미리보기:
-                        {preview[:3000]}
-                        
-                        [형식]
-                        1. (핵심 내용 1)
-                        2. (핵심 내용 2)
-                        3. (핵심 내용 3)
-                        """
-                        res = self.llm.invoke(prompt)
-                        summary_text = res.content.strip()
-                        r['summary'] = summary_text
-                        
-                        # 히스토리 업데이트
-                        if r.get('key'):
-                            self.history[r['key']]['summary'] = summary_text
-                            self._save_history()
-                        print(f"      ✅ 요약 생성 완료")
-                except Exception as e:
-                    print(f"      ⚠️ 요약 생성 실패: {e}")
+                preview = self._extract_text_preview(r['files'][0], max_pages=5)
+                if len(preview.strip()) >= SUMMARY_MIN_PREVIEW_CHARS:
+                    todo.append((r, preview))
+                    continue
+                # 다음 요청에서 다시 추출/요약을 시도하지 않도록 표시 문구를 이력에 남김
+                print(f"   ⏭️ [Auto-Sum] 본문이 거의 없어 요약 생략: {r['title']}")
+                r['summary'] = SUMMARY_SKIPPED
+                if r.get('key'):
+                    self.history[r['key']]['summary'] = SUMMARY_SKIPPED
+                    self._history_dirty = True
+
+        if todo:
+            with ThreadPoolExecutor(max_workers=SUMMARY_CONCURRENCY) as pool:
+                summaries = list(pool.map(lambda item: self._auto_summarize(*item), todo))
+            for (r, _), summary_text in zip(todo, summaries):
+                if summary_text is None:
+                    continue
+                r['summary'] = summary_text
+                # 히스토리 업데이트 (저장은 아래에서 한 번만)
+                if r.get('key'):
+                    self.history[r['key']]['summary'] = summary_text
+                    self._history_dirty = True
+
+        self._flush_history()
 
         if recent_reports:
-            result_str += "### 🆕 관련 보고서 및 문서\n"
+            yield "### 🆕 관련 보고서 및 문서\n"
             for r in recent_reports:
                 files_msg = ""
                 # 원본 URL이 있으면 우선 표시
                 if r.get('origin_url'):
                     files_msg = f"[원문 보기]({r['origin_url']})"
                 elif r['files']:
-                    links = []
-                    for f in r['files']:
-                        fname = os.path.basename(f)
-                        url = f"http://localhost:8000/static/domestic/{fname}"
-                        links.append(f"[다운로드]({url})")
-                    files_msg = ", ".join(links)
+                    files_msg = ", ".join(DOWNLOAD_LINK_TEMPLATE.format(os.path.basename(f)) for f in r['files'])
                 else:
                     files_msg = "파일 없음"
                 
-                result_str += f"- {r['title']}\n"
-                result_str += f"  - 🔗 링크: {files_msg}\n"
+                yield f"- {r['title']}\n"
+                yield f"  - 🔗 링크: {files_msg}\n"
                 if r.get('summary'):
-                    result_str += f"  - 📝 요약:\n{r['summary']}\n"
+                    yield f"  - 📝 요약:\n{r['summary']}\n"
                 else:
-                    result_str += f"  - 📝 요약: (요약 없음)\n"
+                    yield f"  - 📝 요약: (요약 없음)\n"
         else:
-            result_str += "### 🆕 최신 보고서 및 법령 개정안\n"
-            result_str += "- 수집된 문서가 없습니다.\n"
+            yield "### 🆕 최신 보고서 및 법령 개정안\n"
+            yield "- 수집된 문서가 없습니다.\n"
             
-        result_str += "\n### ℹ️ 참고\n"
-        result_str += "- 본 리포트는 자동 수집된 데이터를 기반으로 생성됩니다.\n"
-        
-        return result_str
+        yield "\n### ℹ️ 참고\n"
+        yield "- 본 리포트는 자동 수집된 데이터를 기반으로 생성됩니다.\n"
+
+    def _iter_history_newest(self) -> Iterator[Tuple[str, Dict]]:
+        """처리 이력을 최신순으로 생성. 보통 앞쪽 몇 건만 쓰므로 상위 HISTORY_SCAN_WINDOW건만 먼저 고름"""
+        key = lambda item: item[1]['_ts']
+        items = list(self.history.items())
+        yield from heapq.nlargest(HISTORY_SCAN_WINDOW, items, key=key)
+        if len(items) > HISTORY_SCAN_WINDOW:
+            # 파일 소실 등으로 건너뛴 항목이 많을 때만 전체 정렬
+            yield from sorted(items, key=key, reverse=True)[HISTORY_SCAN_WINDOW:]
+
+    def _existing_downloads(self) -> set:
+        """DOWNLOAD_DIR 파일 경로 집합 (디렉터리 1회 스캔, DOWNLOAD_LISTING_TTL초 동안 재사용)"""
+        expires_at, listing = self._download_listing
+        if time.monotonic() >= expires_at:
+            with os.scandir(DOWNLOAD_DIR) as entries:
+                listing = {entry.path for entry in entries if entry.is_file()}
+            self._download_listing = (time.monotonic() + DOWNLOAD_LISTING_TTL, listing)
+        return listing
+
+    @staticmethod
+    def _file_exists(path: str, existing_files: set) -> bool:
+        # 다운로드 폴더 밖의 경로(이전 버전 이력 등)만 개별 stat
+        if os.path.dirname(path) == DOWNLOAD_DIR:
+            return path in existing_files
+        return os.path.exists(path)
+
+    def _auto_summarize(self, report: Dict, preview: str) -> Optional[str]:
+        """리포트 문서 미리보기 3줄 요약 (실패 시 None)"""
+        prompt = f"""
+                        다음 문서의 내용을 한국어로 3줄 요약해주세요.
+                        문서 제목: {report['title']}
+                        내용 미리보기:
+                        {_truncate_tokens(preview, SUMMARY_PREVIEW_MAX_TOKENS)}
+                        
+                        [형식]
+                        1. (핵심 내용 1)
+                        2. (핵심 내용 2)
+                        3. (핵심 내용 3)
+                        """
+        try:
+            summary_text = self.llm.invoke(prompt).content.strip()
+            print(f"      ✅ 요약 생성 완료: {report['title']}")
+            return summary_text
+        except Exception as e:
+            print(f"      ⚠️ 요약 생성 실패 ({report['title']}): {e}")
+            return None
 
     def start_scheduler(self):
-        import threading
+        def safe_crawl():
+            # 한 번의 크롤링 실패로 스케줄러 스레드가 죽지 않도록 다음 주기까지 대기
+            try:
+                self.crawl_updates()
+            except Exception as e:
+                print(f"❌ [Scheduler] 크롤링 중 오류 (다음 주기에 재시도): {e}")
+
         def run_schedule():
             # 시작 시 한 번 체크
-            self.crawl_updates()
-            while True:
-                time.sleep(3600) # 1시간마다 확인
-                self.crawl_updates()
+            safe_crawl()
+            # 1시간마다 확인 (stop_scheduler()가 호출되면 대기 중에도 바로 종료)
+            while not self._stop.wait(CRAWL_INTERVAL):
+                safe_crawl()
         
         t = threading.Thread(target=run_schedule, daemon=True)
         t.start()
         print("⏰ [System] 백그라운드 크롤링 스케줄러 시작 완료")
 
+    def stop_scheduler(self):
+        """start_scheduler / run_continuously 대기를 깨워 종료"""
+        self._stop.set()
+
     # 기존 함수 유지 (호환성)
-    def monitor_all(self, query: str = "ESG 규제 동향") -> str:
+    def monitor_all(self, query: str = "ESG 규제 동향", batch: bool = False) -> str:
+        """크롤링 + 뉴스 검색/요약 리포트. batch=True면 뉴스 요약을 OpenAI Batch API로 제출 (비용 50%, 완료까지 대기)"""
         print("\n" + "="*50)
         print(f"🔄 [모니터링 실행] {time.strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*50)
 
-        # 1. 보고서 수집 (GMI, FSC)
-        gmi_reports = self._fetch_gmi_reports_selenium()
-        fsc_reports = self._fetch_fsc_reports_selenium()
-        
-        # 2. 법령 업데이트 수집
-        legal_updates = self._fetch_legal_updates()
-        
-        reports = gmi_reports + fsc_reports + legal_updates
+        # 1~2. 보고서(GMI, FSC) 및 법령 업데이트 수집
+        reports = self._collect_updates()
         
-        # 3. 뉴스 검색
+        # 3. 뉴스 검색 (질의별 요청을 동시에, 연결은 공유 클라이언트로 재사용)
         news_results = []
         if os.getenv("TAVILY_API_KEY"):
-            queries = list(set([query, "ESG 공시 의무화", "환경부 입법예고", "중대재해처벌법 개정"]))
-            for q in queries:
-                try:
-                    raw = self.tavily.invoke(q)
+            queries = list(dict.fromkeys((query, *NEWS_QUERIES)))  # 순서를 유지한 중복 제거
+            with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+                for raw in pool.map(self._search_news, queries):
                     for item in raw:
                         news_results.append({
                             "title": item['content'][:30] + "...", 
@@ -889,8 +1837,6 @@ class RegulationMonitor:
                             "url": item['url'],
                             "source": "Web News"
                         })
-                except Exception as e:
-                    print(f"⚠️ Tavily 검색 실패 ({q}): {e}")
         
         clean_news = self._deduplicate_news(news_results)
         
@@ -909,24 +1855,14 @@ class RegulationMonitor:
             
         result_str += "\n### 📰 주요 뉴스 및 입법 동향 (AI 요약)\n"
         if clean_news:
-            # 상위 3개 뉴스만 요약
+            # 상위 3개 뉴스만 요약 (서로 독립이므로 한 번에 요청)
             top_news = clean_news[:3]
-            for i, n in enumerate(top_news):
-                print(f"   🤖 [AI 요약] 뉴스 {i+1}/{len(top_news)} 요약 중...")
-                try:
-                    prompt = f"""
-                    다음 뉴스 기사를 한국어로 3줄 요약해주세요. 핵심 내용 위주로 간결하게 작성하세요.
-                    
-                    기사 내용: {n['content']}
-                    """
-                    summary_res = self.llm.invoke(prompt)
-                    summary = summary_res.content.strip()
-                    
+            for i, (n, summary) in enumerate(zip(top_news, self._summarize_news(top_news, batch=batch))):
+                if summary is not None:
                     result_str += f"**{i+1}. {n['title']}**\n"
                     result_str += f"{summary}\n"
                     result_str += f"🔗 [원문 보기]({n['url']})\n\n"
-                except Exception as e:
-                    print(f"      ⚠️ 요약 실패: {e}")
+                else:
                     result_str += f"- {n['content'][:100]}...\n  🔗 [기사]({n['url']})\n"
         else:
             result_str += "- 관련 주요 뉴스가 없습니다.\n"
@@ -934,6 +1870,89 @@ class RegulationMonitor:
         print(result_str)
         return result_str
 
+    @staticmethod
+    def _deduplicate_news(news: List[Dict]) -> List[Dict]:
+        """(URL, 본문 앞 64자)가 같은 기사 제거 - 먼저 나온 항목과 순서를 유지
+
+        datasketch가 있으면 본문 단어 shingle의 MinHash LSH로 유사 기사(재배포/전재)도 제거
+        """
+        seen: Dict[Tuple[str, str], Dict] = {}
+        for item in news:
+            seen.setdefault((item['url'], item['content'][:64]), item)
+        unique = list(seen.values())
+        if MinHashLSH is None:
+            return unique
+
+        lsh = MinHashLSH(threshold=NEWS_DEDUP_THRESHOLD, num_perm=NEWS_MINHASH_PERM)
+        kept = []
+        for idx, item in enumerate(unique):
+            words = item['content'].split()
+            minhash = MinHash(num_perm=NEWS_MINHASH_PERM)
+            for i in range(max(1, len(words) - NEWS_SHINGLE_SIZE + 1)):
+                minhash.update(" ".join(words[i:i + NEWS_SHINGLE_SIZE]).encode("utf-8"))
+            if lsh.query(minhash):
+                continue
+            lsh.insert(str(idx), minhash)
+            kept.append(item)
+        return kept
+
+    def _search_news(self, query: str) -> List[Dict]:
+        """Tavily 검색 (신뢰 도메인 한정, 실패 시 빈 목록)"""
+        try:
+            response = self._http.post(TAVILY_SEARCH_URL, json={
+                "api_key": os.getenv("TAVILY_API_KEY"),
+                "query": query,
+                "max_results": NEWS_MAX_RESULTS,
+                "include_domains": TRUSTED_NEWS_DOMAINS,
+            })
+            response.raise_for_status()
+            return response.json().get("results", [])
+        except Exception as e:
+            print(f"⚠️ Tavily 검색 실패 ({query}): {e}")
+            return []
+
+    def close(self):
+        self._stop.set()
+        self._http.close()
+
+    def _summarize_news(self, news: List[Dict], batch: bool = False) -> List[Optional[str]]:
+        """뉴스별 3줄 요약 (입력 순서 유지, 실패한 항목은 None)"""
+        prompts = [
+            f"""
+                    다음 뉴스 기사를 한국어로 3줄 요약해주세요. 핵심 내용 위주로 간결하게 작성하세요.
+                    
+                    기사 내용: {n['content']}
+                    """
+            for n in news
+        ]
+        print(f"   🤖 [AI 요약] 뉴스 {len(news)}건 요약 중{' (Batch API)' if batch else ''}...")
+
+        if batch:
+            from src.tools.policy.utils.batch import run_chat_batch
+            try:
+                results = run_chat_batch(prompts, model=self.llm.model_name, temperature=0)
+            except Exception as e:
+                print(f"      ⚠️ Batch 요약 실패, 개별 요청으로 전환: {e}")
+            else:
+                summaries = []
+                for result in results:
+                    if result.startswith("[ERROR]"):
+                        print(f"      ⚠️ 요약 실패: {result}")
+                        summaries.append(None)
+                    else:
+                        summaries.append(result.strip())
+                return summaries
+
+        def summarize(prompt: str) -> Optional[str]:
+            try:
+                return self.llm.invoke(prompt).content.strip()
+            except Exception as e:
+                print(f"      ⚠️ 요약 실패: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=SUMMARY_CONCURRENCY) as pool:
+            return list(pool.map(summarize, prompts))
+
 # LangChain Tool Export
 _monitor_instance = RegulationMonitor()
 
@@ -945,13 +1964,14 @@ def fetch_regulation_updates(query: str = "ESG regulatory updates") -> str:
     """
     return _monitor_instance.generate_report(query)
 
-def run_continuously(interval_days: int = 1):
+def run_continuously(interval_days: int = 1, batch: bool = False):
     print(f"\n⏰ 스케줄러 시작: {interval_days}일마다 자동 실행됩니다.")
-    _monitor_instance.monitor_all()
-    schedule.every(interval_days).days.do(_monitor_instance.monitor_all)
+    interval = interval_days * 24 * 3600
     while True:
-        schedule.run_pending()
-        time.sleep(60)
+        _monitor_instance.monitor_all(batch=batch)
+        # 다음 실행 시각까지 한 번만 깨어남 (stop_scheduler()로 대기 중에도 중단 가능)
+        if _monitor_instance._stop.wait(interval):
+            break
 
 if __name__ == "__main__":
     # [Mode 1] 단순 테스트 모드
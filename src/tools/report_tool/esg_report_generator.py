@@ -11,6 +11,7 @@ GRI 2021 3단계 구조를 완벽하게 반영한 ESG 보고서 생성 시스템
 통합 모듈: GRI 데이터베이스, 매핑 로직, 보고서 생성, 인덱스 자동 생성
 """
 
+import re
 from typing import Dict, List, Any, Set, Optional
 
 
@@ -42,19 +43,47 @@ GRI_3_REQUIREMENTS = {
 
 # 중대 이슈 → GRI 자동 매핑
 MATERIALITY_TO_GRI = {
-    "기후변화": ["GRI 302", "GRI 305"], "탄소": ["GRI 305"], "에너지": ["GRI 302"],
-    "안전": ["GRI 403"], "보건": ["GRI 403"],
-    "공급망": ["GRI 308", "GRI 414"], "협력사": ["GRI 308", "GRI 414"],
-    "윤리": ["GRI 205", "GRI 206"], "부패": ["GRI 205"],
-    "인권": ["GRI 406", "GRI 407", "GRI 408", "GRI 409"],
-    "물": ["GRI 303"], "수자원": ["GRI 303"], "생물다양성": ["GRI 304"],
-    "폐기물": ["GRI 306"], "순환": ["GRI 301", "GRI 306"],
-    "경제": ["GRI 201"], "재무": ["GRI 201"],
-    "고용": ["GRI 401"], "인재": ["GRI 401", "GRI 404"], "교육": ["GRI 404"],
-    "다양성": ["GRI 405"], "차별": ["GRI 406"],
-    "지역": ["GRI 413"], "품질": ["GRI 416"], "정보": ["GRI 418"]
+    "기후변화": ("GRI 302", "GRI 305"), "탄소": ("GRI 305",), "에너지": ("GRI 302",),
+    "안전": ("GRI 403",), "보건": ("GRI 403",),
+    "공급망": ("GRI 308", "GRI 414"), "협력사": ("GRI 308", "GRI 414"),
+    "윤리": ("GRI 205", "GRI 206"), "부패": ("GRI 205",),
+    "인권": ("GRI 406", "GRI 407", "GRI 408", "GRI 409"),
+    "물": ("GRI 303",), "수자원": ("GRI 303",), "생물다양성": ("GRI 304",),
+    "폐기물": ("GRI 306",), "순환": ("GRI 301", "GRI 306"),
+    "경제": ("GRI 201",), "재무": ("GRI 201",),
+    "고용": ("GRI 401",), "인재": ("GRI 401", "GRI 404"), "교육": ("GRI 404",),
+    "다양성": ("GRI 405",), "차별": ("GRI 406",),
+    "지역": ("GRI 413",), "품질": ("GRI 416",), "정보": ("GRI 418",)
 }
 
+
+def _trie_regex(words) -> str:
+    """키워드 목록 → 접두사를 공유하는 트라이 형태 정규식 (예: 인권/인재 → 인(?:권|재))
+
+    각 노드의 '여기서 끝남'을 탐욕적 ?로 표현하므로 같은 위치에서는 가장 긴 키워드가 매칭됨
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: Dict[str, Any]) -> str:
+        alts = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        is_end = "" in node
+        body = alts[0] if len(alts) == 1 and not is_end else "(?:" + "|".join(alts) + ")"
+        return body + "?" if is_end else body
+
+    return render(trie)
+
+
+# 중대 이슈 키워드 정규식 - 이슈명을 트라이로 한 번 훑어 모든 키워드를 찾음
+# (긴 키워드 우선 - '생물다양성'이 '다양성'/'물'로 잘리지 않도록)
+_KW_RE = re.compile(_trie_regex(MATERIALITY_TO_GRI))
+
 # GRI Topic Standards
 GRI_TOPICS = {
     "GRI 201": {"topic": "경제 성과", "cat": "경제", "indicators": {"201-1": "경제가치 창출", "201-2": "기후변화 재무영향"}},
@@ -81,90 +110,159 @@ GRI_TOPICS = {
     "GRI 418": {"topic": "개인정보", "cat": "사회", "indicators": {"418-1": "개인정보 위반"}}
 }
 
+# 중대 이슈 키워드 → E/S/G 영역 (첫 번째 GRI 코드의 cat 기준, import 시 1회 계산)
+KEYWORD_TO_CAT = {
+    kw: GRI_TOPICS[codes[0]]["cat"]
+    for kw, codes in MATERIALITY_TO_GRI.items()
+    if codes[0] in GRI_TOPICS
+}
+
+# E/S/G 영역별 GRI 코드 집합
+GRI_ECON_CODES = frozenset(code for code, info in GRI_TOPICS.items() if info["cat"] == "경제")
+GRI_ENV_CODES = frozenset(code for code, info in GRI_TOPICS.items() if info["cat"] == "환경")
+GRI_SOC_CODES = frozenset(code for code, info in GRI_TOPICS.items() if info["cat"] == "사회")
+
+# GRI 코드 ↔ 비트 (코드 오름차순으로 부여 → 낮은 비트부터 읽으면 정렬된 코드 순서)
+GRI_CODE_BIT = {code: 1 << i for i, code in enumerate(sorted(GRI_TOPICS))}
+_BIT_TO_CODE = {bit: code for code, bit in GRI_CODE_BIT.items()}
+GRI_ECON_MASK = sum(GRI_CODE_BIT[code] for code in GRI_ECON_CODES)
+GRI_ENV_MASK = sum(GRI_CODE_BIT[code] for code in GRI_ENV_CODES)
+GRI_SOC_MASK = sum(GRI_CODE_BIT[code] for code in GRI_SOC_CODES)
+# 중대 이슈 키워드 → 매핑되는 GRI 코드 비트 합 (GRI_TOPICS에 없는 코드는 인덱스에 나오지 않으므로 제외)
+KEYWORD_TO_MASK = {
+    kw: sum(GRI_CODE_BIT[code] for code in set(codes) if code in GRI_CODE_BIT)
+    for kw, codes in MATERIALITY_TO_GRI.items()
+}
+
+
+def _mask_codes(mask: int) -> List[str]:
+    """비트마스크 → GRI 코드 목록 (오름차순)"""
+    codes = []
+    while mask:
+        low = mask & -mask
+        codes.append(_BIT_TO_CODE[low])
+        mask ^= low
+    return codes
+
+# ESG Highlights 표에서 데이터에 연도 정보가 없을 때 쓰는 열
+HIGHLIGHT_DEFAULT_YEARS = ("2023", "2024", "2025")
+
+# GRI 2 공시별 보고서 내 위치/페이지
+GRI_2_LOCATIONS = {
+    "2-1": ("Company Overview", "5"), "2-2": ("About Report", "2"), "2-3": ("About Report", "2"),
+    "2-6": ("Supply Chain", "45"), "2-7": ("Talent", "40"), "2-9": ("Governance", "65"),
+    "2-10": ("Board", "69"), "2-12": ("Stakeholder", "15"), "2-14": ("Stakeholder", "15"),
+    "2-22": ("CEO Message", "7"), "2-23": ("Ethics", "70"), "2-25": ("Supply CAP", "56"),
+    "2-26": ("Ethics", "71"), "2-27": ("Ethics", "72"), "2-29": ("Stakeholder", "15")
+}
+
+
+def _build_static_prefix() -> str:
+    """GRI Contents Index 중 보고서마다 동일한 부분 (GRI 1/2/3, Sector)"""
+    out: List[str] = []
+    w = out.append
+    w("## GRI Contents Index\n\n본 보고서는 GRI Standards 2021 준수\n\n")
+    
+    # GRI 1
+    w("### GRI 1: Foundation 2021\n")
+    w("**적용 원칙:** " + ", ".join(GRI_1_PRINCIPLES.values()) + "\n\n")
+    
+    # GRI 2
+    w("### GRI 2: General Disclosures 2021\n")
+    w("| 공시 | 제목 | 위치 | 페이지 |\n|-----|------|------|-------|\n")
+    for num in sorted(GRI_2_LOCATIONS.keys()):
+        title = GRI_2_DISCLOSURES[num]["title"]
+        loc, pg = GRI_2_LOCATIONS[num]
+        w(f"| {num} | {title} | {loc} | {pg} |\n")
+    w("\n")
+    
+    # GRI 3
+    w("### GRI 3: Material Topics 2021\n")
+    w("| 공시 | 제목 | 위치 |\n|-----|------|------|\n")
+    w("| 3-1 | 중대 주제 결정 | Materiality Assessment |\n")
+    w("| 3-2 | 중대 주제 목록 | Material Issues Table |\n")
+    w("| 3-3 | 중대 주제 관리 | E/S/G 섹션 |\n\n")
+    
+    # Sector
+    w("### Sector Standards\n건설업 미발행 → SASB 대체\n\n")
+    return "".join(out)
+
+
+# 정적 인덱스는 import 시 한 번만 생성
+_INDEX_STATIC_PREFIX = _build_static_prefix()
+
+# Topic Standards 표 조각: 영역별 제목+표 머리, GRI 코드별 지표 행 (import 시 1회 생성)
+_TOPIC_HEADERS = {
+    cat: f"#### 🔹 {cat} ({series} Series)\n\n| GRI | 공시 | 지표 |\n|-----|------|------|\n"
+    for cat, series in (("경제", "200"), ("환경", "300"), ("사회", "400"))
+}
+_TOPIC_ROWS = {
+    code: "".join(f"| {code} | {num} | {title} |\n" for num, title in info["indicators"].items())
+    for code, info in GRI_TOPICS.items()
+}
+
 
 class GRIMapper:
     """GRI 자동 매핑 및 인덱스 생성"""
     
     def __init__(self):
-        self.applicable_gri: Set[str] = set()
+        # 적용 GRI 코드 집합을 GRI_CODE_BIT 비트마스크로 보관
+        self.applicable_mask = 0
+    
+    @property
+    def applicable_gri(self) -> Set[str]:
+        """적용 GRI 코드 집합 (읽기 전용 사본)"""
+        return set(_mask_codes(self.applicable_mask))
     
     def analyze_issues(self, issues: List[Dict]) -> None:
         """중대 이슈 분석 및 GRI 매핑"""
         for issue in issues:
             if not issue.get("isMaterial"):
                 continue
-            name = issue.get("name", "").lower()
-            for keyword, gri_codes in MATERIALITY_TO_GRI.items():
-                if keyword in name:
-                    self.applicable_gri.update(gri_codes)
+            self.add_keywords(_KW_RE.findall(issue.get("name", "").lower()))
+    
+    def add_keywords(self, keywords: List[str]) -> None:
+        """이슈명에서 찾은 중대 이슈 키워드의 GRI 코드를 적용 대상에 추가"""
+        for keyword in keywords:
+            self.applicable_mask |= KEYWORD_TO_MASK[keyword]
     
     def generate_index(self) -> str:
-        """GRI Contents Index 생성"""
-        md = "## GRI Contents Index\n\n본 보고서는 GRI Standards 2021 준수\n\n"
-        
-        # GRI 1
-        md += "### GRI 1: Foundation 2021\n"
-        md += "**적용 원칙:** " + ", ".join(GRI_1_PRINCIPLES.values()) + "\n\n"
-        
-        # GRI 2
-        md += "### GRI 2: General Disclosures 2021\n"
-        md += "| 공시 | 제목 | 위치 | 페이지 |\n|-----|------|------|-------|\n"
-        gri2_map = {
-            "2-1": ("Company Overview", "5"), "2-2": ("About Report", "2"), "2-3": ("About Report", "2"),
-            "2-6": ("Supply Chain", "45"), "2-7": ("Talent", "40"), "2-9": ("Governance", "65"),
-            "2-10": ("Board", "69"), "2-12": ("Stakeholder", "15"), "2-14": ("Stakeholder", "15"),
-            "2-22": ("CEO Message", "7"), "2-23": ("Ethics", "70"), "2-25": ("Supply CAP", "56"),
-            "2-26": ("Ethics", "71"), "2-27": ("Ethics", "72"), "2-29": ("Stakeholder", "15")
-        }
-        for num in sorted(gri2_map.keys()):
-            title = GRI_2_DISCLOSURES[num]["title"]
-            loc, pg = gri2_map[num]
-            md += f"| {num} | {title} | {loc} | {pg} |\n"
-        md += "\n"
-        
-        # GRI 3
-        md += "### GRI 3: Material Topics 2021\n"
-        md += "| 공시 | 제목 | 위치 |\n|-----|------|------|\n"
-        md += "| 3-1 | 중대 주제 결정 | Materiality Assessment |\n"
-        md += "| 3-2 | 중대 주제 목록 | Material Issues Table |\n"
-        md += "| 3-3 | 중대 주제 관리 | E/S/G 섹션 |\n\n"
-        
-        # Sector
-        md += "### Sector Standards\n건설업 미발행 → SASB 대체\n\n"
-        
-        # Topics
-        if self.applicable_gri:
-            md += "### Topic Standards\n\n"
-            cats = {"경제": [], "환경": [], "사회": []}
-            for code in sorted(self.applicable_gri):
-                if code in GRI_TOPICS:
-                    cats[GRI_TOPICS[code]["cat"]].append(code)
-            
-            for cat, codes in cats.items():
-                if not codes:
-                    continue
-                series = "200" if cat == "경제" else ("300" if cat == "환경" else "400")
-                md += f"#### 🔹 {cat} ({series} Series)\n\n"
-                md += "| GRI | 공시 | 지표 |\n|-----|------|------|\n"
-                for code in codes:
-                    info = GRI_TOPICS[code]
-                    for num, title in info["indicators"].items():
-                        md += f"| {code} | {num} | {title} |\n"
-                md += "\n"
+        """GRI Contents Index 생성 (정적 GRI 1/2/3 표 + 매핑된 Topic Standards)"""
+        return _INDEX_STATIC_PREFIX + self._render_topic_section()
+    
+    def _render_topic_section(self) -> str:
+        """applicable_mask에 해당하는 Topic Standards 표"""
+        if not self.applicable_mask:
+            return ""
+        out: List[str] = []
+        w = out.append
+        w("### Topic Standards\n\n")
+        for cat, cat_mask in (("경제", GRI_ECON_MASK), ("환경", GRI_ENV_MASK), ("사회", GRI_SOC_MASK)):
+            codes = _mask_codes(self.applicable_mask & cat_mask)
+            if not codes:
+                continue
+            w(_TOPIC_HEADERS[cat])
+            out.extend(_TOPIC_ROWS[code] for code in codes)
+            w("\n")
         
-        return md
+        return "".join(out)
 
 
 # ============================================================================
 # 보고서 생성
 # ============================================================================
 
-def _val(arr: List[Dict], year: str) -> str:
-    """연도별 값 추출"""
-    for row in arr:
-        if str(row.get("year", "")).startswith(year):
-            return str(row.get("value", "-"))
-    return "-"
+def _columns(rows: List[Dict], *fields: str) -> List[List[Any]]:
+    """행(dict) 목록 → 필드별 열 목록 (행마다 필드를 한 번씩만 조회)"""
+    return [[row.get(field) for row in rows] for field in fields]
+
+
+def _year_index(years: List[Any], values: List[Any]) -> Dict[str, Any]:
+    """연도(앞 4자리) → 값 (같은 연도가 여러 행이면 앞쪽 행 우선)"""
+    index: Dict[str, Any] = {}
+    for y, v in zip(years, values):
+        index.setdefault("" if y is None else str(y)[:4], "-" if v is None else v)
+    return index
 
 
 def _tag(tags: List[str]) -> str:
@@ -190,13 +288,16 @@ def generate_esg_report(data: Dict[str, Any], standard: str = "GRI") -> str:
     
     env_pol = data.get("env_policy", "")
     climate = data.get("climate_action", "")
-    env_data = data.get("env_chart_data", [])
+    env_data = data.get("env_chart_data") or []
+    env_years, env_values = _columns(env_data, "year", "value")
     
     social_pol = data.get("social_policy", "")
     safety = data.get("safety_management", "")
-    safety_data = data.get("safety_chart_data", [])
+    safety_data = data.get("safety_chart_data") or []
+    safety_years, safety_values = _columns(safety_data, "year", "value")
     supply_pol = data.get("supply_chain_policy", "")
-    supply_risk = data.get("supply_chain_risk", [])
+    supply_risk = data.get("supply_chain_risk") or []
+    supply_cols = _columns(supply_risk, "category", "riskLevel", "action", "status")
     
     gov = data.get("gov_structure", "")
     ethics = data.get("ethics", "")
@@ -205,152 +306,150 @@ def generate_esg_report(data: Dict[str, Any], standard: str = "GRI") -> str:
     # 보고서 시작
     # ---------------------------------------------------------
     title_suffix = "지속가능경영보고서" if standard == "GRI" else "K-ESG 가이드라인 보고서"
-    md = f"# {company} {year} {title_suffix}\n\n"
+    out: List[str] = []
+    w = out.append
+    w(f"# {company} {year} {title_suffix}\n\n")
     
     # About (Always show)
     gri_tag = "**[GRI 2-1, 2-2, 2-3]**\n" if standard == "GRI" else ""
-    md += f"## 📘 About This Report\n\n{gri_tag}\n"
-    md += f"- **📅 기간:** {year}.1.1 ~ {year}.12.31\n"
-    md += f"- **🏢 범위:** {company} 본사, 자회사, 1~2차 협력사\n"
+    w(f"## 📘 About This Report\n\n{gri_tag}\n")
+    w(f"- **📅 기간:** {year}.1.1 ~ {year}.12.31\n")
+    w(f"- **🏢 범위:** {company} 본사, 자회사, 1~2차 협력사\n")
     
     if standard == "GRI":
-        md += "**기준:** GRI 2021, K-ESG, ISO 26000, UN SDGs, SASB, TCFD, CSRD\n"
+        w("**기준:** GRI 2021, K-ESG, ISO 26000, UN SDGs, SASB, TCFD, CSRD\n")
     else:
-        md += "**기준:** K-ESG 가이드라인 v2.0\n"
-    md += "\n"
+        w("**기준:** K-ESG 가이드라인 v2.0\n")
+    w("\n")
     
     # Highlights (show if data exists)
     if env_data or safety_data:
-        md += "## 🏆 ESG Highlights\n\n"
-        md += f"| 분야 | 2023 | 2024 | {year} |\n|------|------|------|------|\n"
-        md += f"| 🌿 환경(GHG) | {_val(env_data,'2023')} | {_val(env_data,'2024')} | {_val(env_data,'2025')} |\n"
-        md += f"| 👷 사회(LTIR) | {_val(safety_data,'2023')} | {_val(safety_data,'2024')} | {_val(safety_data,'2025')} |\n"
-        md += "| 🏛️ 지배구조 | - | - | - |\n\n"
+        w("## 🏆 ESG Highlights\n\n")
+        env_by_year = _year_index(env_years, env_values)
+        safety_by_year = _year_index(safety_years, safety_values)
+        # 열은 데이터에 있는 연도 전체 (연도 정보가 없으면 기본 3개년)
+        years = sorted(y for y in env_by_year.keys() | safety_by_year.keys() if y) or list(HIGHLIGHT_DEFAULT_YEARS)
+        w("| 분야 | " + " | ".join(years) + " |\n|------|" + "------|" * len(years) + "\n")
+        w("| 🌿 환경(GHG) | " + " | ".join(str(env_by_year.get(y, "-")) for y in years) + " |\n")
+        w("| 👷 사회(LTIR) | " + " | ".join(str(safety_by_year.get(y, "-")) for y in years) + " |\n")
+        w("| 🏛️ 지배구조 | " + " | ".join("-" for _ in years) + " |\n\n")
     
     # CEO Message (Removed as per user request)
     # if has_data(ceo):
     #     tag = "**[GRI 2-22]**\n\n" if standard == "GRI" else ""
-    #     md += f"## CEO Message\n{tag}{ceo}\n\n"
+    #     w(f"## CEO Message\n{tag}{ceo}\n\n")
     
     # Company Overview
-    md += "## 🏢 Company Overview\n\n"
-    md += f"- **회사명:** {company}\n- **업종:** {industry}\n\n"
+    w("## 🏢 Company Overview\n\n")
+    w(f"- **회사명:** {company}\n- **업종:** {industry}\n\n")
     if has_data(strategy):
-        md += f"### 🚀 전략\n\n{strategy}\n\n"
+        w(f"### 🚀 전략\n\n{strategy}\n\n")
     
     # Stakeholder
     # Only show generic stakeholder table if it's a standard report (no custom sections)
     custom_sections = data.get("custom_sections", [])
     
     if not custom_sections:
-        md += "## 🤝 ESG & Stakeholder Engagement\n\n"
-        md += "이해관계자 소통 채널 운영 현황\n\n"
-        md += "| 이해관계자 | 관심사 | 채널 |\n|------------|--------|------|\n"
-        md += "| 👥 고객 | 안전·품질 | VOC |\n| 👷 임직원 | 안전·교육 | 교육 |\n"
-        md += "| 🏗️ 협력사 | ESG | 포털 |\n| 💰 투자자 | 공시 | IR |\n| 🏙️ 지역사회 | 환경 | 봉사 |\n\n"
+        w("## 🤝 ESG & Stakeholder Engagement\n\n")
+        w("이해관계자 소통 채널 운영 현황\n\n")
+        w("| 이해관계자 | 관심사 | 채널 |\n|------------|--------|------|\n")
+        w("| 👥 고객 | 안전·품질 | VOC |\n| 👷 임직원 | 안전·교육 | 교육 |\n")
+        w("| 🏗️ 협력사 | ESG | 포털 |\n| 💰 투자자 | 공시 | IR |\n| 🏙️ 지역사회 | 환경 | 봉사 |\n\n")
     
     # Materiality (Only if issues exist)
     mapper = GRIMapper()
     # Allow upstream caller to pass explicit null to skip issues without breaking len()
     issues = data.get("material_issues") or []
-    if issues:
-        mapper.analyze_issues(issues) # Run mapping
     
     # Render Materiality
-    md += "## 📌 Double Materiality Assessment\n\n"
-    md += f"### 주요 이슈 도출 ({len(issues)}건)\n\n"
-    md += "| 이슈 | 중요도(%) | 재무영향(%) | 관련 영역 |\n|------|---------|---------|-----|\n"
+    w("## 📌 Double Materiality Assessment\n\n")
+    w(f"### 주요 이슈 도출 ({len(issues)}건)\n\n")
+    w("| 이슈 | 중요도(%) | 재무영향(%) | 관련 영역 |\n|------|---------|---------|-----|\n")
     for issue in issues:
         ref_str = "-"
-        name_lower = issue.get("name", "").lower()
+        # 이슈명 키워드는 한 번만 찾아 GRI 매핑(중대 이슈만)과 관련 영역 표시에 함께 사용
+        keywords = _KW_RE.findall(issue.get("name", "").lower())
+        if issue.get("isMaterial"):
+            mapper.add_keywords(keywords) # Run mapping
         
         # Simple E/S/G inference for K-ESG
-        categories = []
-        for kw, codes in MATERIALITY_TO_GRI.items():
-            if kw in name_lower:
-                # GRI_TOPICS has 'cat' field (e.g. '환경', '사회', '경제')
-                # Take first code to find category
-                first_code = codes[0]
-                if first_code in GRI_TOPICS:
-                    categories.append(GRI_TOPICS[first_code]['cat'])
+        categories = {KEYWORD_TO_CAT[kw] for kw in keywords if kw in KEYWORD_TO_CAT}
         
         if categories:
              # Unique sorted categories (e.g. "환경, 사회")
-             ref_str = ", ".join(sorted(set(categories)))
+             ref_str = ", ".join(sorted(categories))
         else:
              ref_str = "일반"
 
-        md += f"| {issue['name']} | {issue['impact']} | {issue['financial']} | {ref_str} |\n"
-    md += "\n"
+        w(f"| {issue['name']} | {issue['impact']} | {issue['financial']} | {ref_str} |\n")
+    w("\n")
     
     # ---------------------------------------------------------
     # Custom / Dynamic Sections (Proposed Flexibility)
     # ---------------------------------------------------------
-    if custom_sections:
-        for section in custom_sections:
-            title = section.get("title", "Section")
-            content = section.get("content", "")
-            md += f"## 🚩 {title}\n\n{content}\n\n"
+    out.extend(
+        f"## 🚩 {section.get('title', 'Section')}\n\n{section.get('content', '')}\n\n"
+        for section in custom_sections
+    )
             
     # Standard Sections (Environmental, Social, Governance)
     # These will naturally be skipped if the LLM left them empty as instructed.
     
     # Environmental
     if has_data(env_pol) or has_data(climate) or env_data:
-        md += "## 🌿 Environmental Performance\n\n"
-        if has_data(env_pol): md += f"### 📜 Policy\n\n{env_pol}\n\n"
-        if has_data(climate): md += f"### 🌍 Climate Action\n\n{climate}\n\n"
+        w("## 🌿 Environmental Performance\n\n")
+        if has_data(env_pol): w(f"### 📜 Policy\n\n{env_pol}\n\n")
+        if has_data(climate): w(f"### 🌍 Climate Action\n\n{climate}\n\n")
         if env_data:
-            md += "### 📉 Key Indicators\n\n"
-            for r in env_data:
-                md += f"- {r.get('year')}: {r.get('value')}\n"
-            md += "\n"
+            w("### 📉 Key Indicators\n\n")
+            out.extend(f"- {y}: {v}\n" for y, v in zip(env_years, env_values))
+            w("\n")
 
     # Social
     if has_data(social_pol) or has_data(safety) or safety_data or has_data(supply_pol):
-        md += "## 👥 Social Performance\n\n"
-        if has_data(social_pol): md += f"### ⚖️ Human Rights\n\n{social_pol}\n\n"
-        if has_data(safety): md += f"### 🦺 Safety Management\n\n{safety}\n\n"
+        w("## 👥 Social Performance\n\n")
+        if has_data(social_pol): w(f"### ⚖️ Human Rights\n\n{social_pol}\n\n")
+        if has_data(safety): w(f"### 🦺 Safety Management\n\n{safety}\n\n")
         if safety_data:
-            md += "#### 📊 Safety KPIs\n\n"
-            for r in safety_data:
-                md += f"- {r.get('year')}: {r.get('value')}\n"
-            md += "\n"
+            w("#### 📊 Safety KPIs\n\n")
+            out.extend(f"- {y}: {v}\n" for y, v in zip(safety_years, safety_values))
+            w("\n")
         if has_data(supply_pol):
-            md += f"### 🏗️ Supply Chain\n\n{supply_pol}\n\n"
+            w(f"### 🏗️ Supply Chain\n\n{supply_pol}\n\n")
             if supply_risk:
-                md += "| 카테고리 | 리스크 | 조치 | 현황 |\n|----------|--------|------|------|\n"
-                for r in supply_risk:
-                    md += f"| {r.get('category')} | {r.get('riskLevel')} | {r.get('action')} | {r.get('status')} |\n"
-                md += "\n"
+                w("| 카테고리 | 리스크 | 조치 | 현황 |\n|----------|--------|------|------|\n")
+                out.extend(
+                    f"| {category} | {risk} | {action} | {status} |\n"
+                    for category, risk, action, status in zip(*supply_cols)
+                )
+                w("\n")
 
     # Governance
     if has_data(gov) or has_data(ethics):
-        md += "## ⚖️ Governance\n\n"
-        if has_data(gov): md += f"### 🏛️ Structure\n\n{gov}\n\n"
+        w("## ⚖️ Governance\n\n")
+        if has_data(gov): w(f"### 🏛️ Structure\n\n{gov}\n\n")
         # Committees table removed as it was hardcoded.
-        if has_data(ethics): md += f"### 📜 Ethics\n\n{ethics}\n\n"
+        if has_data(ethics): w(f"### 📜 Ethics\n\n{ethics}\n\n")
 
     # Appendices
     if data.get("esg_data_details") or standard == "GRI":
-        md += "---\n# Appendices\n\n"
+        w("---\n# Appendices\n\n")
     
     # B: ESG Data (Only if details exist)
     if data.get("esg_data_details"):
-        md += "## ESG Data Details\n"
-        for s in data["esg_data_details"]:
-            md += f"### {s.get('title')}\n{s.get('content')}\n\n"
+        w("## ESG Data Details\n")
+        out.extend(f"### {s.get('title')}\n{s.get('content')}\n\n" for s in data["esg_data_details"])
     
     # C: Index
     if standard == "GRI":
-        md += "## GRI Content Index\n"
-        md += mapper.generate_index()
+        w("## GRI Content Index\n")
+        w(mapper.generate_index())
     else:
         # K-ESG Index - only show if we have content for it, otherwise skipping as requested
         # Currently no data for it, so omitting to avoid "Empty Section" complaints.
         pass
     
-    return md
+    return "".join(out)
 
 
 # 샘플 데이터
@@ -19,9 +19,55 @@ import platform
 import subprocess
 import os
 import json
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from datetime import datetime
-from .esg_report_generator import generate_esg_report
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency (없으면 stdlib json)
+    orjson = None
+
+# (작업 폴더, 파일명) → 마지막으로 찾은 데이터 파일 절대 경로
+_RESOLVED: Dict[tuple, str] = {}
+
+class _IssueScores(BaseModel):
+    """material_issues 항목의 점수 필드 스키마 (name 등 나머지 키는 검사하지 않음)
+
+    strict 모드: 문자열 "80" 같은 값을 숫자로 변환하지 않고 오류로 처리
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    impact: Optional[Annotated[float, Field(ge=0, le=100)]] = None
+    financial: Optional[Annotated[float, Field(ge=0, le=100)]] = None
+
+
+# 이슈 목록 검증기 (pydantic-core 스키마를 import 시 한 번만 생성)
+_ISSUES_ADAPTER = TypeAdapter(List[_IssueScores])
+
+
+def _issue_errors(issues: List[Any]) -> List[str]:
+    """material_issues 목록 검증 → 기존 한국어 오류 문구 목록"""
+    try:
+        _ISSUES_ADAPTER.validate_python(issues)
+        return []
+    except ValidationError as exc:
+        errors = []
+        for err in exc.errors():
+            idx = err["loc"][0]
+            if len(err["loc"]) == 1:
+                errors.append(f"이슈 항목 {idx}는 딕셔너리 형식이어야 합니다.")
+                continue
+            field = err["loc"][1]
+            name = issues[idx].get("name", f"Item {idx}")
+            if err["type"] in ("greater_than_equal", "less_than_equal"):
+                errors.append(f"이슈 '{name}': {field}는 0-100 사이여야 합니다 ({err['input']}).")
+            else:
+                errors.append(f"이슈 '{name}': {field}는 숫자여야 합니다.")
+        return errors
+
 
 class DataLoader:
     """데이터 자동 로드 및 검색
@@ -46,22 +92,33 @@ class DataLoader:
         Notes
         -----
         검색 순서: 현재 폴더 -> 상위 폴더 -> 상위의 상위 폴더
+        한 번 찾은 경로는 기억해 두고, 파일이 그대로 있으면 검색 없이 바로 읽습니다.
         """
-        # 검색 경로: 현재 폴더 -> 상위 -> 상위의 상위
-        search_paths = [
-            os.path.join(".", filename),
-            os.path.join("..", filename),
-            os.path.join("..", "..", filename)
-        ]
+        key = (os.getcwd(), filename)
+        cached = _RESOLVED.get(key)
+        if cached and os.path.isfile(cached):
+            search_paths = [cached]
+        else:
+            # 검색 경로: 현재 폴더 -> 상위 -> 상위의 상위
+            search_paths = [
+                os.path.join(".", filename),
+                os.path.join("..", filename),
+                os.path.join("..", "..", filename)
+            ]
         
         for path in search_paths:
-            if os.path.exists(path):
+            if os.path.isfile(path):
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        print(f"[Info] 데이터 파일 발견: {os.path.abspath(path)}")
-                        return data
-                except json.JSONDecodeError as e:
+                    if orjson is not None:
+                        with open(path, "rb") as f:
+                            data = orjson.loads(f.read())
+                    else:
+                        with open(path, "r", encoding="utf-8") as f:
+                            data = json.load(f)
+                    _RESOLVED[key] = os.path.abspath(path)
+                    print(f"[Info] 데이터 파일 발견: {_RESOLVED[key]}")
+                    return data
+                except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError 모두 ValueError 하위
                     print(f"[Warning] JSON 파싱 실패 ({path}): {e}")
                 except Exception as e:
                     print(f"[Warning] 파일 로드 실패 ({path}): {e}")
@@ -223,21 +280,8 @@ class ReportTool:
             if not isinstance(issues, list):
                 errors.append("material_issues는 리스트 형식이어야 합니다.")
             else:
-                for idx, issue in enumerate(issues):
-                    if not isinstance(issue, dict):
-                        errors.append(f"이슈 항목 {idx}는 딕셔너리 형식이어야 합니다.")
-                        continue
-                    
-                    name = issue.get("name", f"Item {idx}")
-                    
-                    # Impact/Financial 점수 검사 (0-100)
-                    for field in ["impact", "financial"]:
-                        val = issue.get(field)
-                        if val is not None:
-                            if not isinstance(val, (int, float)):
-                                errors.append(f"이슈 '{name}': {field}는 숫자여야 합니다.")
-                            elif not (0 <= val <= 100):
-                                errors.append(f"이슈 '{name}': {field}는 0-100 사이여야 합니다 ({val}).")
+                # 항목 형식 및 Impact/Financial 점수(0-100) 검사
+                errors.extend(_issue_errors(issues))
 
         return errors
     
@@ -354,7 +398,8 @@ class ReportTool:
             for err in validation_errors:
                 print(f" - {err}")
         
-        # HTML 보고서 생성
+        # HTML 보고서 생성 (GRI 테이블/인덱스를 만드는 생성기 모듈은 실제로 보고서를 만들 때만 로드)
+        from .esg_report_generator import generate_esg_report
         try:
             report_md = generate_esg_report(data, standard=standard)
         except Exception as e:
@@ -2,6 +2,7 @@ import os
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import urllib.parse
 import numpy as np
 import fitz  # PyMuPDF
@@ -36,6 +37,7 @@ DOWNLOAD_DIR = os.path.join(DATA_DIR, "risk_data")
 HISTORY_DIR = os.path.join(DATA_DIR, "crawling")
 HISTORY_FILE = os.path.join(HISTORY_DIR, "risk_history.json")
 VECTOR_DB_DIR = os.path.join(BASE_DIR, "vector_db", "esg_all")
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 # --------------------------------------------------------------------------
 # [설정] 리스크 진단 자료 타겟 목록
@@ -122,6 +124,13 @@ class RiskCrawlingTool:
         else:
             self.vector_db = None
 
+        # 직접 다운로드용 HTTP 세션 (같은 호스트 연결을 재사용해 TLS 핸드셰이크 절감)
+        self.http = requests.Session()
+        self.http.headers.update({"User-Agent": "Mozilla/5.0"})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
         os.makedirs(HISTORY_DIR, exist_ok=True)
         self.history = self._load_history()
@@ -577,18 +586,14 @@ class RiskCrawlingTool:
             driver.get(search_url)
             WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "search")))
             links = driver.find_elements(By.CSS_SELECTOR, "a")
-            pdf_links = []
+            # URL 기준으로 수집 시점에 바로 중복 제거 (삽입 순서 유지), 3개가 모이면 탐색 중단
+            unique_files: Dict[str, object] = {}
             for link in links:
                 href = link.get_attribute("href")
-                if href and (href.lower().endswith(".pdf") or href.lower().endswith(".hwp")):
-                    pdf_links.append((link, href))
-            seen_urls = set()
-            unique_files = []
-            for l, h in pdf_links:
-                if h not in seen_urls:
-                    unique_files.append((l, h))
-                    seen_urls.add(h)
-            for i, (link_elem, file_url) in enumerate(unique_files[:3]):
+                if href and href not in unique_files and href.lower().endswith((".pdf", ".hwp")):
+                    unique_files[href] = link
+                    if len(unique_files) >= 3: break
+            for file_url, link_elem in unique_files.items():
                 try:
                     title = link_elem.text or "Untitled"
                     unique_key = f"Google_{name}_{title}"
@@ -596,17 +601,20 @@ class RiskCrawlingTool:
                         print(f"   ⏭️ [Skip] {title}")
                         continue
                     print(f"   📥 [Direct Download] {title}")
-                    response = requests.get(file_url, headers={"User-Agent": "Mozilla/5.0"}, timeout=30)
-                    if response.status_code == 200:
+                    with self.http.get(file_url, timeout=30, stream=True) as response:
+                        if response.status_code != 200: continue
                         ext = os.path.splitext(file_url)[1] or ".pdf"
                         safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '-', '_', '.')]).rstrip()[:50]
                         filename = f"{safe_title}{ext}"
                         file_path = os.path.join(DOWNLOAD_DIR, filename)
-                        with open(file_path, 'wb') as f: f.write(response.content)
-                        print(f"      ✅ 다운로드 완료: {filename}")
-                        if self._analyze_and_store(file_path, title, target_info):
-                            self._mark_as_processed(unique_key, title, [file_path])
-                            results.append({"source": name, "title": title, "files": [file_path]})
+                        # 대용량 PDF를 메모리에 올리지 않고 청크 단위로 바로 기록
+                        with open(file_path, 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                    print(f"      ✅ 다운로드 완료: {filename}")
+                    if self._analyze_and_store(file_path, title, target_info):
+                        self._mark_as_processed(unique_key, title, [file_path])
+                        results.append({"source": name, "title": title, "files": [file_path]})
                 except Exception as e: print(f"      ⚠️ File Error: {e}")
         except Exception as e: print(f"❌ Google Error: {e}")
         return results
@@ -0,0 +1,75 @@
+"""vector_db/esg_all (Chroma) → vector_db/esg_all_faiss (FAISS IVF-PQ) 1회성 마이그레이션.
+
+--chroma-dir를 지정하면 다른 저장소(예: esg_all_small)도 <경로>_faiss로 변환한다.
+
+임베딩은 Chroma에 저장된 bge-m3 벡터를 그대로 사용하므로 재임베딩이 필요 없다.
+구축 후 PolicyTool은 faiss가 설치되어 있고 인덱스가 있으면 자동으로 FAISS 경로를 사용한다.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import chromadb
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.tools.policy.utils.faiss_index import build_ivfpq_index, save_index
+
+CHROMA_DIR = "vector_db/esg_all"
+COLLECTION_NAME = "esg_all"
+BATCH_SIZE = 5000
+
+
+def migrate(
+    m: int = 128,
+    nbits: int = 8,
+    nlist: int | None = None,
+    chroma_dir: str = CHROMA_DIR,
+    collection_name: str = COLLECTION_NAME,
+) -> None:
+    # PolicyTool은 <Chroma 경로>_faiss 디렉터리에서 인덱스를 찾음
+    faiss_dir = f"{chroma_dir}_faiss"
+    collection = chromadb.PersistentClient(path=chroma_dir).get_collection(collection_name)
+    total = collection.count()
+    print(f"⚙️  Chroma 컬렉션 로드: {total}개 청크")
+
+    embeddings, docs = [], []
+    for offset in range(0, total, BATCH_SIZE):
+        batch = collection.get(
+            include=["embeddings", "documents", "metadatas"],
+            limit=BATCH_SIZE,
+            offset=offset,
+        )
+        embeddings.append(np.asarray(batch["embeddings"], dtype=np.float32))
+        docs.extend(
+            {"text": text, "metadata": meta or {}}
+            for text, meta in zip(batch["documents"], batch["metadatas"])
+        )
+
+    if not docs:
+        print("⚠️  옮길 청크가 없습니다.")
+        return
+
+    index = build_ivfpq_index(np.vstack(embeddings), m=m, nbits=nbits, nlist=nlist)
+    save_index(faiss_dir, index, docs)
+    print(f"🚀 FAISS 인덱스 저장 완료 ({len(docs)}개) → {faiss_dir}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Chroma → FAISS IVF-PQ migration")
+    parser.add_argument("--chroma-dir", default=CHROMA_DIR, help="원본 Chroma 디렉터리")
+    parser.add_argument("--collection", default=COLLECTION_NAME, help="원본 컬렉션 이름")
+    parser.add_argument("--m", type=int, default=128, help="PQ 서브벡터 개수 (차원의 약수, 384차원 모델이면 48 등)")
+    parser.add_argument("--nbits", type=int, default=8, help="서브벡터당 코드 비트 수")
+    parser.add_argument("--nlist", type=int, default=None, help="IVF 클러스터 수 (기본: 4·√N, 최대 4096)")
+    args = parser.parse_args()
+
+    migrate(
+        m=args.m,
+        nbits=args.nbits,
+        nlist=args.nlist,
+        chroma_dir=args.chroma_dir,
+        collection_name=args.collection,
+    )
@@ -0,0 +1,68 @@
+"""vector_db/esg_all의 청크를 경량 임베딩 모델로 재임베딩해 별도 Chroma 저장소로 저장.
+
+bge-m3(1024차원)보다 작은 다국어 모델(기본: paraphrase-multilingual-MiniLM-L12-v2, 384차원)을 쓰면
+질의 임베딩 forward와 ANN 거리 계산 비용이 크게 줄어든다. 저장 후 PolicyTool에서
+POLICY_EMBED_MODEL / POLICY_VECTOR_DIR / POLICY_COLLECTION 환경변수로 선택한다.
+질의와 문서는 반드시 같은 모델로 임베딩되어야 하므로 모델을 바꾸면 이 스크립트를 다시 실행한다.
+"""
+import shutil
+from pathlib import Path
+
+import chromadb
+from langchain_core.documents import Document
+from langchain_huggingface import HuggingFaceEmbeddings
+from langchain_community.vectorstores import Chroma
+
+SOURCE_DIR = "vector_db/esg_all"
+SOURCE_COLLECTION = "esg_all"
+TARGET_DIR = "vector_db/esg_all_small"
+TARGET_COLLECTION = "esg_all_small"
+DEFAULT_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+BATCH_SIZE = 1000
+
+
+def reembed(
+    model_name: str = DEFAULT_MODEL,
+    target_dir: str = TARGET_DIR,
+    target_collection: str = TARGET_COLLECTION,
+    clear_existing: bool = False,
+) -> None:
+    if clear_existing and Path(target_dir).exists():
+        shutil.rmtree(target_dir)
+
+    source = chromadb.PersistentClient(path=SOURCE_DIR).get_collection(SOURCE_COLLECTION)
+    total = source.count()
+    print(f"⚙️  원본 컬렉션 로드: {total}개 청크 → {model_name}")
+
+    target = Chroma(
+        persist_directory=target_dir,
+        embedding_function=HuggingFaceEmbeddings(model_name=model_name),
+        collection_name=target_collection,
+    )
+    for offset in range(0, total, BATCH_SIZE):
+        batch = source.get(include=["documents", "metadatas"], limit=BATCH_SIZE, offset=offset)
+        target.add_documents(
+            [Document(page_content=text, metadata=meta or {}) for text, meta in zip(batch["documents"], batch["metadatas"])],
+            ids=batch["ids"],
+        )
+        print(f"  - {min(offset + BATCH_SIZE, total)}/{total}")
+
+    print(f"🚀 재임베딩 완료 → {target_dir} ({target_collection})")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Re-embed esg_all with a smaller encoder")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="HuggingFace 임베딩 모델 이름")
+    parser.add_argument("--target-dir", default=TARGET_DIR)
+    parser.add_argument("--collection", default=TARGET_COLLECTION)
+    parser.add_argument("--clear", action="store_true", help="대상 디렉터리를 삭제한 뒤 재구축")
+    args = parser.parse_args()
+
+    reembed(
+        model_name=args.model,
+        target_dir=args.target_dir,
+        target_collection=args.collection,
+        clear_existing=args.clear,
+    )